@@ -7,8 +7,10 @@ Handles order execution, position tracking, and account updates.
 """
 import signal
 import sys
-import time
 from typing import Optional
+from urllib.parse import urlsplit
+
+import redis
 from loguru import logger
 
 from tqsdk_client.config import get_config
@@ -29,12 +31,22 @@ def setup_logging():
     # Remove default handler
     logger.remove()
 
-    # Add console handler with colors
+    # Add console handler; only pay for ANSI colorizing on an interactive
+    # terminal - under systemd/docker plain text is cheaper and friendlier
+    # to log shippers. enqueue=True moves formatting/IO off the hot path.
+    if sys.stdout.isatty():
+        console_format = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>"
+        colorize = True
+    else:
+        console_format = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}"
+        colorize = False
+
     logger.add(
         sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+        format=console_format,
         level="INFO",
-        colorize=True
+        colorize=colorize,
+        enqueue=True
     )
 
     # Add file handler with rotation
@@ -44,7 +56,8 @@ def setup_logging():
         level="INFO",
         rotation="10 MB",
         retention="7 days",
-        compression="zip"
+        compression="zip",
+        enqueue=True
     )
 
 
@@ -73,19 +86,28 @@ def main():
     # Setup logging
     setup_logging()
 
+    # Register signal handlers before any component construction so a
+    # Ctrl+C during TqApi login cannot race into the default handler
+    # (signal_handler already tolerates unpopulated globals)
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
     logger.info("=" * 60)
     logger.info("Starting TqSDK Broker Connect")
     logger.info("=" * 60)
 
     try:
-        # Load configuration
+        # Load configuration (get_config memoizes, so this reads disk once)
         logger.info("Loading configuration...")
         config = get_config()
 
-        logger.info(f"Portfolio ID: {config.portfolio_id}")
-        logger.info(f"Run Mode: {config.run_mode}")
-        logger.info(f"Redis: {config.redis['host']}:{config.redis['port']}")
-        logger.info(f"RabbitMQ: {config.rabbitmq['url']}")
+        # One summary line; log only the RabbitMQ host so credentials in the
+        # URL never reach the logs
+        rabbitmq_host = urlsplit(config.rabbitmq['url']).hostname or ''
+        logger.info(
+            f"Config: portfolio={config.portfolio_id} mode={config.run_mode} "
+            f"redis={config.redis['host']}:{config.redis['port']} rabbitmq={rabbitmq_host}"
+        )
 
         # Check all connections before initialization (5s timeout each)
         if not check_all_connections(config, timeout=5):
@@ -94,17 +116,26 @@ def main():
 
         # Initialize components
         logger.info("Initializing data processor...")
-        data_processor = DataProcessor(config)
+        redis_pool = redis.ConnectionPool(
+            host=config.redis['host'],
+            port=config.redis['port'],
+            password=config.redis.get('password'),
+            db=config.redis.get('db', 0),
+            max_connections=32,
+            health_check_interval=30,
+            decode_responses=True
+        )
+        data_processor = DataProcessor(config, redis_pool=redis_pool)
 
         logger.info("Initializing TQ data stream handler...")
         stream_handler = TqDataStreamHandler(config, data_processor)
 
         logger.info("Initializing order executor...")
-        order_executor = OrderExecutor(config, stream_handler)
-
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        order_executor = OrderExecutor(
+            config,
+            stream_handler,
+            prefetch_count=config.rabbitmq.get('prefetch_count', 10)
+        )
 
         # Start TQ data stream (this will connect to TqApi)
         logger.info("Starting TQ data stream...")
@@ -119,9 +150,9 @@ def main():
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
 
-        # Keep main thread alive
+        # Sleep until a signal arrives instead of polling every second
         while True:
-            time.sleep(1)
+            signal.pause()
 
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
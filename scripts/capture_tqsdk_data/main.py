@@ -13,14 +13,16 @@ Usage:
 """
 
 import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-import json
+import time
 from datetime import datetime, timezone, timedelta
-from pathlib import Path
 from typing import Any, Dict, List
 
 import numpy as np
+import orjson
 import pandas as pd
 from loguru import logger
 from tqsdk import TqApi
@@ -40,25 +42,33 @@ BASE_OUTPUT_DIR = Path("/workspaces/tqsdk_broker_connect/data/tqsdk_api_snapshot
 UTC8 = timezone(timedelta(hours=8))
 
 
-class TqSDKEncoder(json.JSONEncoder):
-    """Custom JSON encoder for TqSDK objects"""
+def _normalize(value: Any) -> Any:
+    """Convert numpy/pandas scalar types to JSON-safe Python natives"""
+    if isinstance(value, (np.integer, np.int64)):
+        return int(value)
+    if isinstance(value, (np.floating, np.float64)):
+        return float(value) if not np.isnan(value) else None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
 
-    def default(self, obj):
-        if isinstance(obj, (np.integer, np.int64)):
-            return int(obj)
-        if isinstance(obj, (np.floating, np.float64)):
-            return float(obj) if not np.isnan(obj) else None
-        if isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
-        if isinstance(obj, Entity):
-            return entity_to_dict(obj)
-        return super().default(obj)
+
+def _orjson_default(obj):
+    """Fallback serializer for types orjson does not handle natively"""
+    if isinstance(obj, Entity):
+        return entity_to_dict(obj)
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def entity_to_dict(entity: Entity) -> Dict[str, Any]:
     """
     Convert TqSDK Entity to dict, recursively handling nested entities
 
+    Entity is a dict subclass, so iterating items() reads the real payload
+    keys directly without going through attribute lookup per field.
+
     Args:
         entity: TqSDK Entity object (Account, Position, Order, etc.)
 
@@ -67,37 +77,25 @@ def entity_to_dict(entity: Entity) -> Dict[str, Any]:
     """
     result = {}
 
-    for key in dir(entity):
-        if key.startswith('_'):
+    for key, value in entity.items():
+        if isinstance(key, str) and key.startswith('_'):
             continue
 
-        if key in ['items', 'keys', 'values', 'get', 'update', 'clear', 'pop', 'popitem', 'setdefault']:
-            continue
-
-        try:
-            value = getattr(entity, key)
-
-            if callable(value):
-                continue
-
-            if isinstance(value, Entity):
-                result[key] = entity_to_dict(value)
-            elif isinstance(value, dict):
-                result[key] = {
-                    k: entity_to_dict(v) if isinstance(v, Entity) else v
-                    for k, v in value.items()
-                    if not k.startswith('_')
-                }
-            elif isinstance(value, list):
-                result[key] = [
-                    entity_to_dict(item) if isinstance(item, Entity) else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
-        except Exception as e:
-            logger.warning(f"Failed to get attribute {key} from entity: {e}")
-            continue
+        if isinstance(value, Entity):
+            result[key] = entity_to_dict(value)
+        elif isinstance(value, dict):
+            result[key] = {
+                k: entity_to_dict(v) if isinstance(v, Entity) else _normalize(v)
+                for k, v in value.items()
+                if not k.startswith('_')
+            }
+        elif isinstance(value, list):
+            result[key] = [
+                entity_to_dict(item) if isinstance(item, Entity) else _normalize(item)
+                for item in value
+            ]
+        else:
+            result[key] = _normalize(value)
 
     return result
 
@@ -106,7 +104,8 @@ def serialize_dataframe(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """
     Convert pandas DataFrame to JSON-serializable list of dicts
 
-    Handles numpy types, NaN values, and timestamps
+    Handles numpy types, NaN values, and timestamps column-wise so the
+    conversion runs in pandas/NumPy C loops instead of per cell
 
     Args:
         df: pandas DataFrame (typically kline data)
@@ -114,23 +113,19 @@ def serialize_dataframe(df: pd.DataFrame) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with clean Python native types
     """
-    records = df.to_dict('records')
+    if df.empty:
+        return []
 
-    serialized = []
-    for record in records:
-        clean_record = {}
-        for key, value in record.items():
-            if isinstance(value, (np.integer, np.int64)):
-                clean_record[key] = int(value)
-            elif isinstance(value, (np.floating, np.float64)):
-                clean_record[key] = float(value) if not np.isnan(value) else None
-            elif isinstance(value, pd.Timestamp):
-                clean_record[key] = value.isoformat()
-            else:
-                clean_record[key] = value
-        serialized.append(clean_record)
+    clean = df.copy()
 
-    return serialized
+    # Convert timestamp columns to ISO strings in one vectorized pass per column
+    for col in clean.select_dtypes(include=['datetime64[ns]', 'datetimetz']).columns:
+        clean[col] = clean[col].dt.strftime('%Y-%m-%dT%H:%M:%S')
+
+    # Box numpy scalars to Python natives and replace NaN with None column-wise
+    clean = clean.astype(object).where(clean.notna(), None)
+
+    return clean.to_dict('records')
 
 
 def capture_account(api: TqApi) -> Dict[str, Any]:
@@ -185,27 +180,25 @@ def capture_trades(api: TqApi) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-def capture_quotes(api: TqApi, symbols: List[str]) -> Dict[str, Any]:
-    """Capture quote data for specified symbols"""
-    quotes = {}
-    for symbol in symbols:
+def capture_quotes(symbols: List[str], quotes: List[Any]) -> Dict[str, Any]:
+    """Capture quote data from pre-subscribed quote entities (local reads only)"""
+    result = {}
+    for symbol, quote in zip(symbols, quotes):
         try:
-            quote = api.get_quote(symbol)
-            quotes[symbol] = entity_to_dict(quote)
+            result[symbol] = entity_to_dict(quote)
         except Exception as e:
             logger.error(f"Error capturing quote for {symbol}: {e}")
-            quotes[symbol] = {"error": str(e)}
-    return quotes
+            result[symbol] = {"error": str(e)}
+    return result
 
 
-def capture_klines(api: TqApi, symbols: List[str], durations: List[int]) -> Dict[str, Any]:
-    """Capture kline data for symbols and durations"""
+def capture_klines(kline_serials: Dict[str, Dict[int, pd.DataFrame]]) -> Dict[str, Any]:
+    """Capture kline data from pre-subscribed kline serials (local reads only)"""
     klines = {}
-    for symbol in symbols:
+    for symbol, by_duration in kline_serials.items():
         klines[symbol] = {}
-        for duration in durations:
+        for duration, df in by_duration.items():
             try:
-                df = api.get_kline_serial(symbol, duration, KLINE_DATA_LENGTH)
                 klines[symbol][f"{duration}s"] = serialize_dataframe(df)
             except Exception as e:
                 logger.error(f"Error capturing kline {symbol}/{duration}s: {e}")
@@ -213,16 +206,20 @@ def capture_klines(api: TqApi, symbols: List[str], durations: List[int]) -> Dict
     return klines
 
 
+# Serialization options computed once instead of per save_json call
+_ORJSON_OPT_COMPACT = orjson.OPT_SERIALIZE_NUMPY
+_ORJSON_OPT_PRETTY = _ORJSON_OPT_COMPACT | orjson.OPT_INDENT_2
+
+
 def save_json(data: Any, filepath: Path, pretty: bool = True):
-    """Save data to JSON file with error handling"""
-    try:
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+    """Save data to JSON file with error handling
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, cls=TqSDKEncoder, indent=2, ensure_ascii=False)
-            else:
-                json.dump(data, f, cls=TqSDKEncoder, ensure_ascii=False)
+    The parent directory must already exist (main() creates the output dir
+    once, so no per-file mkdir syscalls are needed here).
+    """
+    try:
+        option = _ORJSON_OPT_PRETTY if pretty else _ORJSON_OPT_COMPACT
+        filepath.write_bytes(orjson.dumps(data, option=option, default=_orjson_default))
 
         logger.info(f"Saved {filepath.name}")
     except Exception as e:
@@ -270,14 +267,21 @@ def main():
         logger.info("TqApi initialized successfully")
 
         logger.info(f"Subscribing to symbols: {DEMO_SYMBOLS}")
-        for symbol in DEMO_SYMBOLS:
-            api.get_quote(symbol)
-            for duration in KLINE_DURATIONS:
-                api.get_kline_serial(symbol, duration, KLINE_DATA_LENGTH)
-
-        logger.info(f"Waiting for data updates ({UPDATE_ITERATIONS} iterations)...")
+        quotes = api.get_quote_list(DEMO_SYMBOLS)
+        kline_serials = {
+            symbol: {
+                duration: api.get_kline_serial(symbol, duration, KLINE_DATA_LENGTH)
+                for duration in KLINE_DURATIONS
+            }
+            for symbol in DEMO_SYMBOLS
+        }
+
+        logger.info(f"Waiting for data updates (up to {UPDATE_ITERATIONS} iterations)...")
         for i in range(UPDATE_ITERATIONS):
-            api.wait_update(deadline=2)
+            api.wait_update(deadline=time.time() + 2)
+            if all(quote.datetime for quote in quotes):
+                logger.info(f"All quotes delivered after {i + 1} update(s)")
+                break
             if i % 10 == 0:
                 logger.info(f"Update iteration {i}/{UPDATE_ITERATIONS}")
 
@@ -297,10 +301,10 @@ def main():
         trades_data = capture_trades(api)
 
         logger.info("Capturing quotes...")
-        quotes_data = capture_quotes(api, DEMO_SYMBOLS)
+        quotes_data = capture_quotes(DEMO_SYMBOLS, quotes)
 
         logger.info("Capturing klines...")
-        klines_data = capture_klines(api, DEMO_SYMBOLS, KLINE_DURATIONS)
+        klines_data = capture_klines(kline_serials)
 
         logger.info("-" * 60)
         logger.info("Saving data to files...")
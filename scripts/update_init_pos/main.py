@@ -22,12 +22,24 @@ Usage:
     python main.py --snapshot 202601081530 --output my_pos.csv
 """
 
+import os
 import sys
-import json
-import re
+import csv
 import argparse
+from operator import itemgetter
 from pathlib import Path
-import pandas as pd
+
+import ijson
+
+# TqSDK exchange ID -> qpto_engine exchange ID
+EXCHANGE_MAP = {
+    'CZCE': 'XZCE',
+    'SHFE': 'XSGE',
+    'DCE': 'XDCE',
+    'INE': 'XINE',
+    'CFFEX': 'CCFX',
+    'GFEX': 'GFEX'
+}
 
 
 def map_exchange_id(tqsdk_exchange: str) -> str:
@@ -43,15 +55,7 @@ def map_exchange_id(tqsdk_exchange: str) -> str:
     Returns:
         qpto_engine exchange ID (e.g., 'XZCE', 'XSGE')
     """
-    exchange_map = {
-        'CZCE': 'XZCE',
-        'SHFE': 'XSGE',
-        'DCE': 'XDCE',
-        'INE': 'XINE',
-        'CFFEX': 'CCFX',
-        'GFEX': 'GFEX'
-    }
-    return exchange_map.get(tqsdk_exchange, tqsdk_exchange)
+    return EXCHANGE_MAP.get(tqsdk_exchange, tqsdk_exchange)
 
 
 def extract_product_code(instrument_id: str) -> str:
@@ -70,10 +74,10 @@ def extract_product_code(instrument_id: str) -> str:
     Returns:
         Product code in uppercase (e.g., 'AP', 'M', 'RB', 'AU')
     """
-    match = re.match(r'([a-zA-Z]+)', instrument_id)
-    if not match:
-        return None
-    return match.group(1).upper()
+    i = 0
+    while i < len(instrument_id) and instrument_id[i].isalpha():
+        i += 1
+    return instrument_id[:i].upper() if i else None
 
 
 def get_snapshot_base_dir() -> Path:
@@ -92,12 +96,17 @@ def get_init_pos_dir() -> Path:
 
 def find_latest_snapshot(snapshot_base_dir: Path) -> Path:
     """Find the latest snapshot directory"""
-    snapshot_dirs = sorted([d for d in snapshot_base_dir.glob("202*") if d.is_dir()], reverse=True)
-
-    if not snapshot_dirs:
+    with os.scandir(snapshot_base_dir) as it:
+        latest = max(
+            (e for e in it if e.name.startswith('202') and e.is_dir()),
+            key=lambda e: e.name,
+            default=None
+        )
+
+    if latest is None:
         raise FileNotFoundError(f"No snapshot directories found in {snapshot_base_dir}")
 
-    return snapshot_dirs[0]
+    return Path(latest.path)
 
 
 def get_snapshot_dir(snapshot_timestamp: str = None) -> tuple[Path, str]:
@@ -143,15 +152,15 @@ def generate_output_filename(snapshot_timestamp: str) -> Path:
     return init_pos_dir / f"init_pos_{snapshot_date}.csv"
 
 
-def load_position_snapshot(snapshot_dir: Path) -> dict:
-    """Load positions.json from snapshot directory"""
+def iter_position_snapshot(snapshot_dir: Path):
+    """Stream (contract_key, position_info) pairs from positions.json"""
     positions_file = snapshot_dir / "positions.json"
 
     if not positions_file.exists():
         raise FileNotFoundError(f"Positions file not found: {positions_file}")
 
-    with open(positions_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(positions_file, 'rb') as f:
+        yield from ijson.kvitems(f, '')
 
 
 def convert_snapshot_to_init_pos(snapshot_dir: Path, output_file: Path):
@@ -164,44 +173,32 @@ def convert_snapshot_to_init_pos(snapshot_dir: Path, output_file: Path):
     """
     print(f"Reading positions from: {snapshot_dir}")
 
-    # Load positions data
-    positions_data = load_position_snapshot(snapshot_dir)
-
     results = []
 
-    for contract_key, position_info in positions_data.items():
+    # Stream positions.json entry by entry instead of loading it whole;
+    # each filter bails out before doing any further extraction work
+    for contract_key, position_info in iter_position_snapshot(snapshot_dir):
         # Skip if no position
         pos = position_info.get('pos', 0)
-        if pos == 0:
+        if not pos:
             continue
 
-        # Extract exchange and instrument
-        exchange_id = position_info.get('exchange_id', '')
-        instrument_id = position_info.get('instrument_id', '')
-
-        if not exchange_id or not instrument_id:
+        exchange_id = position_info.get('exchange_id')
+        instrument_id = position_info.get('instrument_id')
+        if not (exchange_id and instrument_id):
             print(f"Warning: Missing exchange_id or instrument_id for {contract_key}, skipping")
             continue
 
-        # Extract product code
         product = extract_product_code(instrument_id)
-        if not product:
+        if product is None:
             print(f"Warning: Could not extract product from {instrument_id}, skipping")
             continue
 
-        # Map TqSDK exchange to qpto_engine exchange
-        mapped_exchange = map_exchange_id(exchange_id)
-
-        # Format symbol as {exchange}_{product}
-        symbol = f"{mapped_exchange}_{product}"
-
-        # Position is already signed (positive=long, negative=short)
+        # Format symbol as {exchange}_{product}; position is already signed
+        # (positive=long, negative=short)
+        symbol = f"{map_exchange_id(exchange_id)}_{product}"
         position = int(pos)
-
-        results.append({
-            'symbol': symbol,
-            'position': position
-        })
+        results.append((symbol, position))
 
         # Print conversion info (similar to GUI converter)
         direction = "买" if position > 0 else "卖"
@@ -210,15 +207,16 @@ def convert_snapshot_to_init_pos(snapshot_dir: Path, output_file: Path):
     # Save output
     if not results:
         print("Warning: No positions found!")
-        output_df = pd.DataFrame(columns=['symbol', 'position'])
     else:
-        output_df = pd.DataFrame(results)
         # Sort by symbol for consistent output
-        output_df = output_df.sort_values('symbol').reset_index(drop=True)
+        results.sort(key=itemgetter(0))
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_df.to_csv(output_file, index=False)
-    print(f"\nSaved {len(output_df)} positions to {output_file}")
+    with output_file.open('w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['symbol', 'position'])
+        writer.writerows(results)
+    print(f"\nSaved {len(results)} positions to {output_file}")
 
 
 def main():
@@ -10,6 +10,7 @@ Usage:
 """
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -29,18 +30,24 @@ def find_latest_init_pos() -> Path:
     if not init_pos_dir.exists():
         raise FileNotFoundError(f"Init pos directory not found: {init_pos_dir}")
 
-    # Find all init_pos_*.csv files
-    init_pos_files = sorted(init_pos_dir.glob("init_pos_*.csv"), reverse=True)
+    # Scan for the newest init_pos_*.csv without sorting the whole listing
+    with os.scandir(init_pos_dir) as it:
+        latest = max(
+            (e for e in it
+             if e.name.startswith('init_pos_') and e.name.endswith('.csv') and e.is_file()),
+            key=lambda e: e.name,
+            default=None
+        )
 
-    if not init_pos_files:
+    if latest is None:
         raise FileNotFoundError(f"No init pos files found in {init_pos_dir}")
 
-    return init_pos_files[0]
+    return Path(latest.path)
 
 
 def sync_to_remote(local_file: Path, remote_host: str, remote_path: str):
     """
-    Sync local file to remote server using scp
+    Sync local file to remote server using rsync over SSH
 
     Args:
         local_file: Local file path
@@ -51,34 +58,28 @@ def sync_to_remote(local_file: Path, remote_host: str, remote_path: str):
 
     print(f"Syncing {local_file.name} to {remote_target}...")
 
-    # Use scp to copy the file
-    cmd = ["scp", str(local_file), remote_target]
+    # rsync delta transfer only sends changed blocks; --inplace skips the
+    # temp-file rename and SSH connection multiplexing amortizes handshakes
+    # across repeated syncs
+    cmd = [
+        "rsync", "-az", "--inplace", "--partial",
+        "-e", "ssh -o ControlMaster=auto -o ControlPath=~/.ssh/cm-%r@%h:%p -o ControlPersist=60s",
+        str(local_file), remote_target
+    ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
-            print(f"Successfully synced to {remote_target}")
-        else:
-            print(f"Error: scp failed with return code {result.returncode}")
-            if result.stderr:
-                print(f"stderr: {result.stderr}")
-            sys.exit(1)
+        # Stream rsync output straight to the terminal; check=True raises on
+        # nonzero exit so no manual returncode branch is needed
+        subprocess.run(cmd, check=True)
+        print(f"Successfully synced to {remote_target}")
 
     except subprocess.CalledProcessError as e:
         print(f"Error: Failed to sync file to {remote_target}")
         print(f"Command: {' '.join(cmd)}")
         print(f"Return code: {e.returncode}")
-        if e.stderr:
-            print(f"stderr: {e.stderr}")
         sys.exit(1)
     except FileNotFoundError:
-        print("Error: scp command not found. Please ensure scp is installed.")
+        print("Error: rsync command not found. Please ensure rsync is installed.")
         sys.exit(1)
 
 
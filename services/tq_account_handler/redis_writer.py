@@ -1,15 +1,23 @@
 """
 Redis writer for account updates
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 from loguru import logger
 
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
-
 from shared.redis_client import RedisClient
 
 
+def _extract_account_data(update: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the account fields stored in Redis from an update message"""
+    return {
+        'balance': update.get('balance', 0),
+        'available': update.get('available', 0),
+        'margin': update.get('margin', 0),
+        'risk_ratio': update.get('risk_ratio', 0),
+        'position_profit': update.get('position_profit', 0)
+    }
+
+
 class AccountRedisWriter:
     """Writer for account updates to Redis"""
 
@@ -20,13 +28,7 @@ class AccountRedisWriter:
         """Write account update to Redis"""
         try:
             portfolio_id = update.get('portfolio_id')
-            account_data = {
-                'balance': update.get('balance', 0),
-                'available': update.get('available', 0),
-                'margin': update.get('margin', 0),
-                'risk_ratio': update.get('risk_ratio', 0),
-                'position_profit': update.get('position_profit', 0)
-            }
+            account_data = _extract_account_data(update)
 
             self.redis_client.set_account(portfolio_id, account_data)
             logger.debug(f"Account written: balance={account_data['balance']:.2f}")
@@ -35,3 +37,19 @@ class AccountRedisWriter:
         except Exception as e:
             logger.error(f"Failed to write account: {e}")
             return False
+
+    def write_account_updates(self, updates: List[Dict[str, Any]]) -> bool:
+        """Write a batch of account updates to Redis in one pipelined round trip"""
+        try:
+            accounts = [
+                (update.get('portfolio_id'), _extract_account_data(update))
+                for update in updates
+            ]
+
+            self.redis_client.set_accounts(accounts)
+            logger.debug(f"{len(accounts)} account update(s) written")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to write account batch: {e}")
+            return False
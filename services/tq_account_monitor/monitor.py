@@ -1,6 +1,7 @@
 """
 Account monitoring logic using TqApi wait_update()
 """
+import time
 from typing import Dict, Any, Callable, Optional
 from loguru import logger
 from tqsdk import TqApi
@@ -9,21 +10,34 @@ from tqsdk import TqApi
 class AccountMonitor:
     """Monitor account changes from TqApi"""
 
+    # Account fields whose change should trigger a published update
+    MONITORED_FIELDS = ["balance", "available", "margin", "risk_ratio", "position_profit"]
+
+    # Minimum seconds between publishes: ticks arriving faster than this
+    # overwrite the pending update instead of each going downstream
+    PUBLISH_INTERVAL = 0.1
+
     def __init__(self, api: TqApi, portfolio_id: str):
         self.api = api
         self.portfolio_id = portfolio_id
-        self.previous_account: Optional[Dict[str, Any]] = None
         self.running = False
+        self._pending_update: Optional[Dict[str, Any]] = None
+        self._last_publish_ts = 0.0
 
     def start(self, on_update: Callable[[Dict[str, Any]], None]):
         """Start monitoring account changes"""
         self.running = True
         logger.info("Account monitor started")
 
+        # Pre-bind the per-tick calls: at quote tick rates the repeated
+        # attribute lookups in the loop body are measurable
+        wait_update = self.api.wait_update
+        check_updates = self._check_account_updates
+
         while self.running:
             try:
-                self.api.wait_update()
-                self._check_account_updates(on_update)
+                wait_update()
+                check_updates(on_update)
             except Exception as e:
                 if self.running:
                     logger.error(f"Error in account monitor loop: {e}")
@@ -37,37 +51,35 @@ class AccountMonitor:
         """Check for account changes and publish updates"""
         account = self.api.get_account()
 
-        current_account = {
-            'balance': account.balance,
-            'available': account.available,
-            'margin': account.margin,
-            'risk_ratio': account.risk_ratio if hasattr(account, 'risk_ratio') else 0,
-            'position_profit': account.position_profit if hasattr(account, 'position_profit') else 0
-        }
-
-        # Check if account changed
-        if self.previous_account is None or self._account_changed(current_account):
-            update = {
+        # is_changing answers against the diff set the SDK already computed
+        # for this wait_update tick, so unchanged ticks cost a single lookup
+        # instead of building and comparing a fresh snapshot dict
+        if self.api.is_changing(account, self.MONITORED_FIELDS):
+            # risk_ratio is rounded so sub-basis-point float noise does not
+            # count as a fresh update
+            self._pending_update = {
                 'type': 'ACCOUNT_UPDATE',
                 'portfolio_id': self.portfolio_id,
-                **current_account
+                'balance': account.balance,
+                'available': account.available,
+                'margin': account.margin,
+                'risk_ratio': round(account.risk_ratio, 4) if hasattr(account, 'risk_ratio') else 0,
+                'position_profit': account.position_profit if hasattr(account, 'position_profit') else 0
             }
 
-            logger.info(f"Account update: balance={current_account['balance']:.2f}")
-            on_update(update)
-
-        self.previous_account = current_account
+        # Coalesce: on a fast tick stream only the latest snapshot within
+        # each publish interval goes out, capping downstream RabbitMQ and
+        # Redis load at ~1/PUBLISH_INTERVAL writes per second
+        if self._pending_update is None:
+            return
 
-    def _account_changed(self, current: Dict[str, Any]) -> bool:
-        """Check if account state changed significantly"""
-        if self.previous_account is None:
-            return True
+        now = time.time()
+        if now - self._last_publish_ts < self.PUBLISH_INTERVAL:
+            return
 
-        # Check for significant changes (threshold 0.01 to avoid float noise)
-        for key in ['balance', 'available', 'margin', 'position_profit']:
-            prev_val = self.previous_account.get(key, 0)
-            curr_val = current.get(key, 0)
-            if abs(prev_val - curr_val) > 0.01:
-                return True
+        update = self._pending_update
+        self._pending_update = None
+        self._last_publish_ts = now
 
-        return False
+        logger.info(f"Account update: balance={update['balance']:.2f}")
+        on_update(update)
@@ -1,19 +1,30 @@
 """
 RabbitMQ publisher for account updates
 """
-from typing import Dict, Any
+import queue
+import threading
+import time
+from typing import Dict, Any, List
 from loguru import logger
 
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
-
 from shared.config import Config
 from shared.constants import INTERNAL_EXCHANGE, ROUTING_KEY_ACCOUNT_UPDATES
 from shared.rabbitmq_client import RabbitMQPublisher
 
 
 class AccountUpdatePublisher:
-    """Publisher for account updates to internal queue"""
+    """
+    Publisher for account updates to internal queue.
+
+    publish() only enqueues: a background drain thread batches updates and
+    talks to RabbitMQ, so broker RTT or a reconnect never blocks the TqApi
+    thread calling into the monitor.
+    """
+
+    QUEUE_MAX = 10_000
+    BATCH_MAX = 64
+    BATCH_WINDOW = 0.05
+    DROP_WARN_INTERVAL = 5.0
 
     def __init__(self, config: Config):
         self.publisher = RabbitMQPublisher(
@@ -23,14 +34,69 @@ class AccountUpdatePublisher:
         )
         self.publisher.connect()
 
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_MAX)
+        self._running = True
+        self._last_drop_warn = 0.0
+        self._drain_thread = threading.Thread(
+            target=self._drain_loop,
+            name="account-update-publisher",
+            daemon=True
+        )
+        self._drain_thread.start()
+
     def publish(self, update: Dict[str, Any]):
-        """Publish account update to internal queue"""
+        """Enqueue an account update; never blocks the caller"""
         try:
-            self.publisher.publish(ROUTING_KEY_ACCOUNT_UPDATES, update)
-            logger.debug(f"Published account update")
-        except Exception as e:
-            logger.error(f"Failed to publish account update: {e}")
+            self._queue.put_nowait(update)
+        except queue.Full:
+            # Keep the freshest snapshot: drop the oldest queued update
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(update)
+            except queue.Full:
+                pass
+
+            now = time.monotonic()
+            if now - self._last_drop_warn >= self.DROP_WARN_INTERVAL:
+                logger.warning("Account update queue full, dropping oldest updates")
+                self._last_drop_warn = now
+
+    def publish_batch(self, updates: List[Dict[str, Any]]):
+        """Enqueue a batch of account updates"""
+        for update in updates:
+            self.publish(update)
+
+    def _drain_loop(self):
+        """Drain queued updates and publish them in batches"""
+        while self._running or not self._queue.empty():
+            try:
+                update = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            batch = [update]
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self.publisher.publish_batch(ROUTING_KEY_ACCOUNT_UPDATES, batch)
+                logger.debug(f"Published {len(batch)} account update(s)")
+            except Exception as e:
+                logger.error(f"Failed to publish account updates: {e}")
 
     def close(self):
-        """Close publisher connection"""
+        """Stop the drain thread and close the publisher connection"""
+        self._running = False
+        if self._drain_thread.is_alive():
+            self._drain_thread.join(timeout=5)
         self.publisher.close()
@@ -2,9 +2,45 @@
 TqApi order cancellation logic
 """
 import time
+from typing import Dict, List, Set, Tuple
 from loguru import logger
 from tqsdk import TqApi
 
+# Per-api cache of (order ids already classified, alive orders by id).
+# A session book accumulates thousands of finished orders; caching lets
+# repeated cancel scans touch only new orders and the shrinking alive set
+# instead of rescanning the whole book every time.
+_order_cache: Dict[int, Tuple[Set[str], Dict[str, object]]] = {}
+
+
+def _get_alive_orders(api: TqApi) -> List:
+    """Return the current ALIVE orders, scanning only new or cached-alive entries"""
+    seen, alive = _order_cache.setdefault(id(api), (set(), {}))
+
+    orders = api.get_order()
+
+    # Classify orders that appeared since the last scan
+    for order_id in orders.keys() - seen:
+        seen.add(order_id)
+        order = orders[order_id]
+        if order.status == "ALIVE" and not order.is_dead:
+            alive[order_id] = order
+
+    # Evict cached orders that have since finished
+    for order_id in [oid for oid, order in alive.items()
+                     if order.status != "ALIVE" or order.is_dead]:
+        del alive[order_id]
+
+    return list(alive.values())
+
+
+def normalize_instrument_id(code: str) -> str:
+    """Strip the exchange prefix from a contract code (EXCHANGE.symbol)"""
+    if not code:
+        return ""
+    return code.split(".", 1)[-1]
+
+
 def cancel_all(api: TqApi, order_id: str) -> bool:
     """
     Cancel all alive orders via TqApi
@@ -17,12 +53,7 @@ def cancel_all(api: TqApi, order_id: str) -> bool:
         True if all cancellations completed successfully, False otherwise
     """
     try:
-        orders = api.get_order()
-
-        alive_orders = [
-            order for order in orders.values()
-            if order.status == "ALIVE"
-        ]
+        alive_orders = _get_alive_orders(api)
 
         if not alive_orders:
             logger.info("No alive orders to cancel")
@@ -30,29 +61,38 @@ def cancel_all(api: TqApi, order_id: str) -> bool:
 
         logger.info(f"Found {len(alive_orders)} alive orders to cancel")
 
+        # Send every cancel first so the broker round trips run in parallel,
+        # then wait once for the aggregate condition instead of per order
         for order in alive_orders:
             try:
                 logger.info(f"Cancelling order: {order.order_id}")
                 api.cancel_order(order)
+            except Exception as e:
+                logger.error(f"Failed to cancel order {order.order_id}: {e}")
+                continue
 
-                start_time = time.time()
-                timeout = 1.0
-
-                while order.status == "ALIVE" and not order.is_dead:
-                    if time.time() - start_time > timeout:
-                        logger.error(f"Order cancel timeout after {timeout}s: {order.order_id}")
-                        break
+        timeout = 1.0
+        deadline = time.time() + timeout * len(alive_orders)
 
-                    api.wait_update()
+        # Shrink the pending set each tick instead of rescanning the full
+        # list: total work across all wait_update ticks stays O(orders)
+        pending = {order.order_id: order for order in alive_orders}
 
-                if order.status == "FINISHED" or order.is_dead:
-                    logger.info(f"Order cancelled successfully: {order.order_id}")
-                else:
-                    logger.warning(f"Order cancel failed: {order.order_id} status={order.status}")
+        while pending:
+            if time.time() > deadline:
+                logger.error(f"Cancel-all timeout after {timeout * len(alive_orders):.1f}s")
+                break
+            api.wait_update()
+            pending = {
+                order_id: order for order_id, order in pending.items()
+                if order.status == "ALIVE" and not order.is_dead
+            }
 
-            except Exception as e:
-                logger.error(f"Failed to cancel order {order.order_id}: {e}")
-                continue
+        for order in alive_orders:
+            if order.status == "FINISHED" or order.is_dead:
+                logger.info(f"Order cancelled successfully: {order.order_id}")
+            else:
+                logger.warning(f"Order cancel failed: {order.order_id} status={order.status}")
 
         logger.info("Finished cancelling all alive orders")
         return True
@@ -62,6 +102,59 @@ def cancel_all(api: TqApi, order_id: str) -> bool:
         return False
 
 
+def cancel_orders(api: TqApi, order_ids: List[str]) -> bool:
+    """
+    Cancel a batch of orders with one order-book lookup and one wait cycle.
+
+    Returns True if the cancel flow completed, False otherwise.
+    """
+    try:
+        orders = api.get_order()
+
+        to_cancel = [
+            orders[order_id] for order_id in order_ids
+            if order_id in orders and orders[order_id].status == "ALIVE"
+        ]
+
+        skipped = len(order_ids) - len(to_cancel)
+        if skipped:
+            logger.warning(f"{skipped} of {len(order_ids)} orders not found or not alive")
+
+        if not to_cancel:
+            return True
+
+        for order in to_cancel:
+            logger.info(f"Cancelling order: {order.order_id}")
+            api.cancel_order(order)
+
+        timeout = 1.0
+        deadline = time.time() + timeout * len(to_cancel)
+
+        pending = {order.order_id: order for order in to_cancel}
+
+        while pending:
+            if time.time() > deadline:
+                logger.error(f"Cancel-batch timeout after {timeout * len(to_cancel):.1f}s")
+                break
+            api.wait_update()
+            pending = {
+                order_id: order for order_id, order in pending.items()
+                if order.status == "ALIVE" and not order.is_dead
+            }
+
+        for order in to_cancel:
+            if order.status == "FINISHED" or order.is_dead:
+                logger.info(f"Order cancelled successfully: {order.order_id}")
+            else:
+                logger.warning(f"Order cancel failed: {order.order_id} status={order.status}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to cancel order batch: {e}")
+        return False
+
+
 def cancel_order(api: TqApi, order_id: str) -> bool:
     """
     Cancel an order via TqApi
@@ -102,16 +195,12 @@ def cancel_orders_by_contract(api: TqApi, contract_code: str) -> bool:
     Returns True if the cancel flow completed, False otherwise.
     """
     try:
-        orders = api.get_order()
-        def normalize_instrument_id(code: str) -> str:
-            if not code:
-                return ""
-            return code.split(".", 1)[-1]
+        # Normalize the target once instead of per order in the scan
+        target = normalize_instrument_id(contract_code)
 
         alive_orders = [
-            order for order in orders.values()
-            if order.status == "ALIVE"
-            and normalize_instrument_id(getattr(order, "instrument_id", "")) == normalize_instrument_id(contract_code)
+            order for order in _get_alive_orders(api)
+            if normalize_instrument_id(getattr(order, "instrument_id", "")) == target
         ]
 
         if not alive_orders:
@@ -122,8 +211,21 @@ def cancel_orders_by_contract(api: TqApi, contract_code: str) -> bool:
             logger.info(f"Cancelling order: {order.order_id} contract={contract_code}")
             api.cancel_order(order)
 
-        while any(order.status == "ALIVE" for order in alive_orders):
+        timeout = 1.0
+        deadline = time.time() + timeout * len(alive_orders)
+
+        pending = {order.order_id: order for order in alive_orders}
+
+        while pending:
+            if time.time() > deadline:
+                logger.error(f"Cancel timeout for contract {contract_code} "
+                             f"after {timeout * len(alive_orders):.1f}s")
+                break
             api.wait_update()
+            pending = {
+                order_id: order for order_id, order in pending.items()
+                if order.status == "ALIVE" and not order.is_dead
+            }
 
         logger.info(f"Cancelled {len(alive_orders)} orders for contract: {contract_code}")
         return True
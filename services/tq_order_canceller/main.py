@@ -5,12 +5,13 @@ TQ Order Canceller Service
 Consumes CANCEL order requests from external RabbitMQ and cancels via TqApi.
 """
 import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from shared.aiopika_tqapi_base import AioPikaTqApiService
 from shared.constants import EXTERNAL_ORDER_CANCEL_QUEUE, EXTERNAL_ORDER_EXCHANGE
 
-from worker import process_order_cancel
+from worker import process_order_cancel, process_order_cancels
 
 
 class OrderCancellerService(AioPikaTqApiService):
@@ -33,6 +34,9 @@ class OrderCancellerService(AioPikaTqApiService):
     def process_message_in_worker(self, message: dict) -> bool:
         return process_order_cancel(self.api, message)
 
+    def process_messages_in_worker(self, messages: list) -> bool:
+        return process_order_cancels(self.api, messages)
+
 
 if __name__ == "__main__":
     service = OrderCancellerService()
@@ -2,13 +2,40 @@
 Order cancellation worker logic
 Runs in worker thread, processes cancel requests
 """
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
 
 from loguru import logger
 from tqsdk import TqApi
 
-from executor import cancel_order, cancel_orders_by_contract, cancel_all
+from executor import cancel_order, cancel_orders, cancel_orders_by_contract, cancel_all
+
+
+def process_order_cancels(api: TqApi, messages: list) -> bool:
+    """
+    Process a batch of cancel requests.
+
+    Single-order cancels are aggregated into one cancel_orders call (one
+    order-book lookup and one wait cycle for the whole batch); everything
+    else falls through to process_order_cancel per message.
+    """
+    order_ids = []
+    others = []
+    for message in messages:
+        if (message.get('action') == 'CANCEL'
+                and message.get('type', 'order_id') == 'order_id'
+                and message.get('order_id')):
+            order_ids.append(message['order_id'])
+        else:
+            others.append(message)
+
+    success = True
+    if order_ids:
+        logger.info(f"Cancelling {len(order_ids)} orders in one batch")
+        if not cancel_orders(api, order_ids):
+            success = False
+    for message in others:
+        if not process_order_cancel(api, message):
+            success = False
+    return success
 
 
 def process_order_cancel(api: TqApi, message: dict) -> bool:
@@ -33,6 +60,11 @@ def process_order_cancel(api: TqApi, message: dict) -> bool:
             logger.info(f"Cancelling orders for contract: {contract_code}")
             return cancel_orders_by_contract(api, contract_code)
         elif cancel_type == 'order_id':
+            order_ids = message.get('order_ids')
+            if order_ids:
+                logger.info(f"Cancelling {len(order_ids)} orders")
+                return cancel_orders(api, order_ids)
+
             order_id = message.get('order_id')
             if not order_id:
                 logger.error("Missing order_id")
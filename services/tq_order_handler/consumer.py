@@ -1,8 +1,6 @@
 """
 RabbitMQ consumer for order updates
 """
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
 
 from shared.config import Config
 from shared.constants import INTERNAL_EXCHANGE, INTERNAL_ORDER_UPDATES_QUEUE, ROUTING_KEY_ORDER_UPDATES
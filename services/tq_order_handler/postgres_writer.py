@@ -1,18 +1,77 @@
 """
 PostgreSQL writer for order updates
 """
+import io
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 from loguru import logger
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+from psycopg2.extras import execute_values
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 
 from shared.config import Config
-from shared.models import OrderHistoryFuturesChn, TradeHistoryFuturesChn
+from shared.db import get_engine
+from shared.models import OrderHistoryFuturesChn
+
+# Hot statements built once at import: reusing the same text() object lets
+# SQLAlchemy hit its compiled-statement cache on every call instead of
+# re-lexing the SQL string per message
+_UPDATE_ORDER_SQL = text("""
+    UPDATE order_history_futures_chn
+    SET
+        exchange_order_id = :exchange_order_id,
+        exchange_id = :exchange_id,
+        volume_left = :volume_left,
+        price_type = :price_type,
+        volume_condition = :volume_condition,
+        time_condition = :time_condition,
+        insert_date_time = :insert_date_time,
+        last_msg = :last_msg,
+        status = :status,
+        is_dead = :is_dead,
+        is_online = :is_online,
+        is_error = :is_error,
+        trade_price = :trade_price,
+        exchange_trading_date = :exchange_trading_date,
+        updated_at = NOW()
+    WHERE order_id = :order_id
+""")
+
+_INSERT_TRADES_SQL = text("""
+    INSERT INTO trade_history_futures_chn (
+        trade_id, order_id, exchange_trade_id, exchange_id, instrument_id,
+        direction, order_offset, price, volume, commission, trade_date_time,
+        user_id, seqno, qpto_portfolio_id
+    ) VALUES (
+        :trade_id, :order_id, :exchange_trade_id, :exchange_id, :instrument_id,
+        :direction, :order_offset, :price, :volume, :commission, :trade_date_time,
+        :user_id, :seqno, :qpto_portfolio_id
+    )
+    ON CONFLICT (trade_id) DO NOTHING
+""")
+
+# Above this many trade rows (a reconnect replaying a backlog), COPY into a
+# session temp table beats even a batched INSERT
+_TRADE_COPY_THRESHOLD = 200
+
+_TRADE_COLUMNS = (
+    "trade_id, order_id, exchange_trade_id, exchange_id, instrument_id, "
+    "direction, order_offset, price, volume, commission, trade_date_time, "
+    "user_id, seqno, qpto_portfolio_id"
+)
+
+
+def _copy_field(value: Any) -> str:
+    """Render one value for COPY text format (tab-separated)"""
+    if value is None:
+        # COPY text format spells NULL as \N; str(None) would insert the
+        # literal string 'None' (or fail outright on numeric columns)
+        return '\\N'
+    if isinstance(value, str):
+        return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    return str(value)
 
 
 class OrderPostgresWriter:
@@ -20,127 +79,247 @@ class OrderPostgresWriter:
 
     def __init__(self, config: Config):
         self.config = config
-        db_config = config.database
-        db_url = f"postgresql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['dbname']}"
-        self.engine = create_engine(db_url, pool_pre_ping=True)
-        self.Session = sessionmaker(bind=self.engine)
+        # Process-wide engine shared with any other writer in this process,
+        # so a single pool serves both instead of two half-idle ones
+        self.engine = get_engine(config)
+        # One long-lived core connection: every write reuses the same wire
+        # session instead of paying a pool checkout (and pre-ping) per call
+        self._conn = self.engine.connect()
         logger.info("PostgreSQL connection established")
 
+    def _reconnect(self):
+        """Replace the long-lived connection after a disconnect"""
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = self.engine.connect()
+        logger.info("PostgreSQL connection re-established")
+
     def write_order_update(self, order_data: Dict[str, Any]) -> bool:
         """Write order update to database (only updates mutable fields)"""
-        session = self.Session()
         try:
             order = OrderHistoryFuturesChn.from_dict(order_data)
 
-            # Check if order exists
-            exists_sql = text("SELECT 1 FROM order_history_futures_chn WHERE order_id = :order_id")
-            exists = session.execute(exists_sql, {'order_id': order.order_id}).fetchone()
+            # Update only fields that can change during order lifecycle
+            # Also update TqSDK fields that might be populated later.
+            # rowcount doubles as the existence check, so no separate
+            # SELECT probe round trip
+            with self._conn.begin():
+                result = self._conn.execute(_UPDATE_ORDER_SQL, {
+                    'order_id': order.order_id,
+                    'exchange_order_id': order.exchange_order_id,
+                    'exchange_id': order.exchange_id,
+                    'volume_left': order.volume_left,
+                    'price_type': order.price_type,
+                    'volume_condition': order.volume_condition,
+                    'time_condition': order.time_condition,
+                    'insert_date_time': order.insert_date_time,
+                    'last_msg': order.last_msg,
+                    'status': order.status,
+                    'is_dead': order.is_dead,
+                    'is_online': order.is_online,
+                    'is_error': order.is_error,
+                    'trade_price': order.trade_price,
+                    'exchange_trading_date': order.exchange_trading_date
+                })
 
-            if not exists:
-                logger.warning(f"Order {order.order_id} does not exist in database, cannot update")
-                return False
+                if result.rowcount == 0:
+                    logger.warning(f"Order {order.order_id} does not exist in database, cannot update")
+                    return False
+
+                # Process trade_records if present
+                if order.trade_records:
+                    self._write_trade_records(self._conn, order.order_id, order.trade_records, order.qpto_portfolio_id)
 
-            # Update only fields that can change during order lifecycle
-            # Also update TqSDK fields that might be populated later
-            update_sql = text("""
-                UPDATE order_history_futures_chn
-                SET
-                    exchange_order_id = :exchange_order_id,
-                    exchange_id = :exchange_id,
-                    volume_left = :volume_left,
-                    price_type = :price_type,
-                    volume_condition = :volume_condition,
-                    time_condition = :time_condition,
-                    insert_date_time = :insert_date_time,
-                    last_msg = :last_msg,
-                    status = :status,
-                    is_dead = :is_dead,
-                    is_online = :is_online,
-                    is_error = :is_error,
-                    trade_price = :trade_price,
-                    exchange_trading_date = :exchange_trading_date,
-                    updated_at = NOW()
-                WHERE order_id = :order_id
-            """)
-
-            session.execute(update_sql, {
-                'order_id': order.order_id,
-                'exchange_order_id': order.exchange_order_id,
-                'exchange_id': order.exchange_id,
-                'volume_left': order.volume_left,
-                'price_type': order.price_type,
-                'volume_condition': order.volume_condition,
-                'time_condition': order.time_condition,
-                'insert_date_time': order.insert_date_time,
-                'last_msg': order.last_msg,
-                'status': order.status,
-                'is_dead': order.is_dead,
-                'is_online': order.is_online,
-                'is_error': order.is_error,
-                'trade_price': order.trade_price,
-                'exchange_trading_date': order.exchange_trading_date
-            })
-
-            # Process trade_records if present
-            if order.trade_records:
-                self._write_trade_records(session, order.order_id, order.trade_records, order.qpto_portfolio_id)
-
-            session.commit()
             logger.debug(f"Order update written: {order.order_id} status={order.status}")
             return True
 
+        except DBAPIError as e:
+            logger.error(f"Failed to write order update: {e}", exc_info=True)
+            if e.connection_invalidated:
+                self._reconnect()
+            return False
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to write order update: {e}", exc_info=True)
             return False
-        finally:
-            session.close()
 
-    def _write_trade_records(self, session, order_id: str, trade_records: Dict[str, Any], portfolio_id: str):
-        """Write trade records to trade_history_futures_chn table"""
+    def write_order_updates(self, updates: List[Dict[str, Any]]) -> bool:
+        """
+        Write a batch of order updates in one transaction.
+
+        One execute_values UPDATE covers the whole batch, so N messages
+        cost one round trip and one commit/fsync instead of N of each.
+        """
+        if not updates:
+            return True
+
         try:
-            for trade_id, trade_data in trade_records.items():
-                # Check if trade already exists
-                exists = session.execute(text("""
-                    SELECT 1 FROM trade_history_futures_chn WHERE trade_id = :trade_id
-                """), {'trade_id': trade_id}).fetchone()
-
-                if exists:
-                    logger.debug(f"Trade {trade_id} already exists, skipping")
-                    continue
-
-                # Create TradeHistoryFuturesChn object from dict
-                trade = TradeHistoryFuturesChn(
-                    trade_id=trade_id,
-                    order_id=order_id,
-                    exchange_trade_id=trade_data.get('exchange_trade_id', ''),
-                    exchange_id=trade_data.get('exchange_id', ''),
-                    instrument_id=trade_data.get('instrument_id', ''),
-                    direction=trade_data.get('direction', ''),
-                    order_offset=trade_data.get('offset', ''),
-                    price=float(trade_data.get('price', 0)),
-                    volume=int(trade_data.get('volume', 0)),
-                    commission=float(trade_data.get('commission', 0)),
-                    trade_date_time=int(trade_data.get('trade_date_time', 0)),
-                    user_id=trade_data.get('user_id', ''),
-                    seqno=int(trade_data.get('seqno', 0)),
-                    qpto_portfolio_id=portfolio_id
-                )
-
-                insert_sql = text("""
-                    INSERT INTO trade_history_futures_chn (
-                        trade_id, order_id, exchange_trade_id, exchange_id, instrument_id,
-                        direction, order_offset, price, volume, commission, trade_date_time,
-                        user_id, seqno, qpto_portfolio_id
-                    ) VALUES (
-                        :trade_id, :order_id, :exchange_trade_id, :exchange_id, :instrument_id,
-                        :direction, :order_offset, :price, :volume, :commission, :trade_date_time,
-                        :user_id, :seqno, :qpto_portfolio_id
+            orders = [OrderHistoryFuturesChn.from_dict(update) for update in updates]
+
+            # A fast fill puts several updates for one order in the same
+            # batch (NEW -> PARTIAL_FILL -> FINISHED), and the VALUES join
+            # applies an arbitrary matching row per order. Collapse to the
+            # last update per order_id - messages arrive in order, so the
+            # final dict entry is the terminal state
+            latest = {order.order_id: order for order in orders}
+
+            rows = [(
+                order.order_id,
+                order.exchange_order_id,
+                order.exchange_id,
+                order.volume_left,
+                order.price_type,
+                order.volume_condition,
+                order.time_condition,
+                order.insert_date_time,
+                order.last_msg,
+                order.status,
+                order.is_dead,
+                order.is_online,
+                order.is_error,
+                order.trade_price,
+                order.exchange_trading_date
+            ) for order in latest.values()]
+
+            # execute_values needs the DBAPI cursor; the transaction is
+            # still managed on the long-lived core connection
+            with self._conn.begin(), self._conn.connection.cursor() as cur:
+                execute_values(cur, """
+                    UPDATE order_history_futures_chn AS o
+                    SET
+                        exchange_order_id = v.exchange_order_id,
+                        exchange_id = v.exchange_id,
+                        volume_left = v.volume_left,
+                        price_type = v.price_type,
+                        volume_condition = v.volume_condition,
+                        time_condition = v.time_condition,
+                        insert_date_time = v.insert_date_time,
+                        last_msg = v.last_msg,
+                        status = v.status,
+                        is_dead = v.is_dead,
+                        is_online = v.is_online,
+                        is_error = v.is_error,
+                        trade_price = v.trade_price,
+                        exchange_trading_date = v.exchange_trading_date,
+                        updated_at = NOW()
+                    FROM (VALUES %s) AS v(
+                        order_id, exchange_order_id, exchange_id, volume_left,
+                        price_type, volume_condition, time_condition,
+                        insert_date_time, last_msg, status, is_dead, is_online,
+                        is_error, trade_price, exchange_trading_date
                     )
-                """)
+                    WHERE o.order_id = v.order_id
+                """, rows, page_size=100)
 
-                session.execute(insert_sql, trade.to_dict())
-                logger.debug(f"Trade record inserted: {trade_id}")
+                for order in orders:
+                    if order.trade_records:
+                        self._write_trade_records_cur(cur, order.order_id,
+                                                      order.trade_records,
+                                                      order.qpto_portfolio_id)
+
+            logger.debug(f"{len(orders)} order update(s) written")
+            return True
+
+        except DBAPIError as e:
+            logger.error(f"Failed to write order update batch: {e}", exc_info=True)
+            if e.connection_invalidated:
+                self._reconnect()
+            return False
+        except Exception as e:
+            logger.error(f"Failed to write order update batch: {e}", exc_info=True)
+            return False
+
+    def _write_trade_records_cur(self, cur, order_id: str, trade_records: Dict[str, Any], portfolio_id: str):
+        """Write trade records on a raw cursor within the batch transaction"""
+        # Tuples built straight from the message dict: no existence probe
+        # and no ORM object per row, Postgres deduplicates on trade_id
+        rows = [(
+            trade_id,
+            order_id,
+            trade_data.get('exchange_trade_id', ''),
+            trade_data.get('exchange_id', ''),
+            trade_data.get('instrument_id', ''),
+            trade_data.get('direction', ''),
+            trade_data.get('offset', ''),
+            float(trade_data.get('price', 0)),
+            int(trade_data.get('volume', 0)),
+            float(trade_data.get('commission', 0)),
+            int(trade_data.get('trade_date_time', 0)),
+            trade_data.get('user_id', ''),
+            int(trade_data.get('seqno', 0)),
+            portfolio_id
+        ) for trade_id, trade_data in trade_records.items()]
+
+        if len(rows) > _TRADE_COPY_THRESHOLD:
+            self._bulk_insert_trades_copy(cur, rows)
+        else:
+            execute_values(cur, """
+                INSERT INTO trade_history_futures_chn (
+                    trade_id, order_id, exchange_trade_id, exchange_id, instrument_id,
+                    direction, order_offset, price, volume, commission, trade_date_time,
+                    user_id, seqno, qpto_portfolio_id
+                ) VALUES %s
+                ON CONFLICT (trade_id) DO NOTHING
+            """, rows, page_size=100)
+        logger.debug(f"{len(rows)} trade record(s) upserted for order {order_id}")
+
+    def _bulk_insert_trades_copy(self, cur, rows: List[tuple]):
+        """
+        Bulk-load a large trade backlog via COPY.
+
+        Rows are streamed into a session temp table (already unlogged, no
+        WAL) with COPY FROM STDIN, then folded into the real table with one
+        INSERT ... ON CONFLICT. For thousands of rows this dwarfs even a
+        batched INSERT. Everything runs inside the caller's transaction.
+        """
+        cur.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS trade_history_futures_chn_stage "
+            "(LIKE trade_history_futures_chn INCLUDING DEFAULTS)"
+        )
+
+        buf = io.StringIO()
+        for row in rows:
+            buf.write('\t'.join(_copy_field(value) for value in row))
+            buf.write('\n')
+        buf.seek(0)
+
+        cur.copy_expert(
+            f"COPY trade_history_futures_chn_stage ({_TRADE_COLUMNS}) FROM STDIN",
+            buf
+        )
+        cur.execute(
+            f"INSERT INTO trade_history_futures_chn ({_TRADE_COLUMNS}) "
+            f"SELECT {_TRADE_COLUMNS} FROM trade_history_futures_chn_stage "
+            "ON CONFLICT (trade_id) DO NOTHING"
+        )
+        cur.execute("TRUNCATE trade_history_futures_chn_stage")
+        logger.info(f"{len(rows)} trade record(s) bulk-loaded via COPY")
+
+    def _write_trade_records(self, conn, order_id: str, trade_records: Dict[str, Any], portfolio_id: str):
+        """Write trade records to trade_history_futures_chn table"""
+        try:
+            rows = [{
+                'trade_id': trade_id,
+                'order_id': order_id,
+                'exchange_trade_id': trade_data.get('exchange_trade_id', ''),
+                'exchange_id': trade_data.get('exchange_id', ''),
+                'instrument_id': trade_data.get('instrument_id', ''),
+                'direction': trade_data.get('direction', ''),
+                'order_offset': trade_data.get('offset', ''),
+                'price': float(trade_data.get('price', 0)),
+                'volume': int(trade_data.get('volume', 0)),
+                'commission': float(trade_data.get('commission', 0)),
+                'trade_date_time': int(trade_data.get('trade_date_time', 0)),
+                'user_id': trade_data.get('user_id', ''),
+                'seqno': int(trade_data.get('seqno', 0)),
+                'qpto_portfolio_id': portfolio_id
+            } for trade_id, trade_data in trade_records.items()]
+
+            # One INSERT for the lot; ON CONFLICT replaces the per-trade
+            # existence probe and lets Postgres deduplicate on trade_id
+            conn.execute(_INSERT_TRADES_SQL, rows)
+            logger.debug(f"{len(rows)} trade record(s) upserted")
 
         except Exception as e:
             logger.error(f"Failed to write trade records: {e}")
@@ -148,5 +327,9 @@ class OrderPostgresWriter:
 
     def close(self):
         """Close database connection"""
-        self.engine.dispose()
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        # The shared engine is disposed at process exit by shared.db
         logger.info("PostgreSQL connection closed")
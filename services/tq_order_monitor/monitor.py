@@ -1,13 +1,30 @@
 """
 Order monitoring logic using TqApi wait_update()
 """
-from typing import Dict, Any, Callable
+from operator import attrgetter
+from typing import Dict, Any, Callable, List, Tuple
 from loguru import logger
 from tqsdk import TqApi
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
 from shared.models import OrderHistoryFuturesChn
 
+# Event type by (status, fully filled, partially filled): one dict lookup
+# replaces the chained string compares per changed order
+_EVENT_TYPES = {
+    ("FINISHED", True, False): "COMPLETE_FILL",
+    ("FINISHED", True, True): "COMPLETE_FILL",
+    ("FINISHED", False, True): "CANCELED",
+    ("FINISHED", False, False): "CANCELED",
+    ("ALIVE", False, True): "PARTIAL_FILL",
+    ("ALIVE", True, True): "PARTIAL_FILL",
+    ("ALIVE", False, False): "NEW",
+    ("ALIVE", True, False): "NEW",
+}
+
+# One packed attribute read for the FINISHED debug line; the attributes
+# always exist on TqSDK orders, so no per-call getattr defaults
+_DBG_ATTRS = attrgetter('is_dead', 'is_error', 'is_online',
+                        'exchange_id', 'exchange_order_id')
+
 
 class OrderMonitor:
     """Monitor order changes from TqApi"""
@@ -15,18 +32,25 @@ class OrderMonitor:
     def __init__(self, api: TqApi, portfolio_id: str):
         self.api = api
         self.portfolio_id = portfolio_id
-        self.previous_orders: Dict[str, Dict[str, Any]] = {}
+        # Snapshot per order as a flat tuple: one C-level equality check
+        # against the previous tick instead of five dict lookups per side
+        self.previous_orders: Dict[str, Tuple] = {}
         self.running = False
 
-    def start(self, on_update: Callable[[Dict[str, Any]], None]):
-        """Start monitoring order changes"""
+    def start(self, on_updates: Callable[[List[Dict[str, Any]]], bool]):
+        """
+        Start monitoring order changes.
+
+        on_updates receives all updates of one tick as a list and returns
+        True once they are published.
+        """
         self.running = True
         logger.info("Order monitor started")
 
         while self.running:
             try:
                 self.api.wait_update()
-                self._check_order_updates(on_update)
+                self._check_order_updates(on_updates)
             except Exception as e:
                 if self.running:
                     logger.error(f"Error in order monitor loop: {e}")
@@ -36,74 +60,70 @@ class OrderMonitor:
         self.running = False
         logger.info("Order monitor stopping...")
 
-    def _check_order_updates(self, on_update: Callable[[Dict[str, Any]], None]):
-        """Check for order changes and publish updates"""
+    def _check_order_updates(self, on_updates: Callable[[List[Dict[str, Any]]], bool]):
+        """Check for order changes and publish one batch per tick"""
         orders = self.api.get_order()
 
+        # Skip the whole scan on ticks that did not touch any order
+        if not self.api.is_changing(orders):
+            return
+
+        updates: List[Dict[str, Any]] = []
+        snapshots: List[Tuple[str, Tuple]] = []
+
         # Process each order and check if it changed
         for order_id, order in orders.items():
-            current_state = {
-                'status': order.status,
-                'volume_left': order.volume_left,
-                'volume_orign': order.volume_orign,
-                'exchange_order_id': getattr(order, 'exchange_order_id', ''),
-                'exchange_id': getattr(order, 'exchange_id', '')
-            }
+            current_state = (
+                order.status,
+                order.volume_left,
+                order.volume_orign,
+                getattr(order, 'exchange_order_id', ''),
+                getattr(order, 'exchange_id', '')
+            )
 
             # Check against our tracking to detect changes
-            prev = self.previous_orders.get(order_id)
-            if prev is None or self._order_changed(prev, current_state):
-                # Debug: Log raw TqSDK order attributes for FINISHED orders
+            if self.previous_orders.get(order_id) != current_state:
+                # Debug: log raw TqSDK order attributes for FINISHED orders.
+                # lazy=True defers the attribute reads until a sink actually
+                # accepts DEBUG records
                 if order.status == "FINISHED":
-                    logger.info(f"[DEBUG] Raw TqSDK order {order_id}: "
-                               f"is_dead={getattr(order, 'is_dead', 'MISSING')} "
-                               f"is_error={getattr(order, 'is_error', 'MISSING')} "
-                               f"is_online={getattr(order, 'is_online', 'MISSING')} "
-                               f"exchange_id={getattr(order, 'exchange_id', 'MISSING')} "
-                               f"exchange_order_id={getattr(order, 'exchange_order_id', 'MISSING')}")
+                    logger.opt(lazy=True).debug(
+                        "Raw TqSDK order {} (is_dead, is_error, is_online, "
+                        "exchange_id, exchange_order_id)={}",
+                        lambda: order_id, lambda: _DBG_ATTRS(order)
+                    )
 
-                # Convert TqSDK order to OrderHistoryFuturesChn model
-                order_model = OrderHistoryFuturesChn.from_tqsdk_order(order, self.portfolio_id)
+                # Build the update dict straight from the TqSDK order,
+                # skipping the intermediate dataclass + asdict round trip
+                update = OrderHistoryFuturesChn.from_tqsdk_order_dict(order, self.portfolio_id)
 
                 # Determine event type
                 event_type = self._determine_event_type(order)
 
-                # Create update dict with all fields
-                update = order_model.to_dict()
                 update['type'] = 'ORDER_UPDATE'
                 update['event_type'] = event_type
 
-                # Debug log for troubleshooting
-                logger.info(f"Order update: {order_id} {event_type} status={order.status} volume_left={order.volume_left} "
-                           f"is_dead={order_model.is_dead} exchange_id={order_model.exchange_id} "
-                           f"exchange_order_id={order_model.exchange_order_id}")
-                on_update(update)
-
-                # Update our tracking
-                self.previous_orders[order_id] = current_state
-
-    def _order_changed(self, prev: Dict[str, Any], curr: Dict[str, Any]) -> bool:
-        """Check if order state changed - comparing key mutable fields"""
-        if prev is None:
-            return True
-
-        # Check all fields that can change during order lifecycle
-        return (prev.get('status') != curr.get('status') or
-                prev.get('volume_left') != curr.get('volume_left') or
-                prev.get('volume_orign') != curr.get('volume_orign') or
-                prev.get('exchange_order_id') != curr.get('exchange_order_id') or
-                prev.get('exchange_id') != curr.get('exchange_id'))
+                # Deferred {} formatting: nothing is rendered when DEBUG
+                # records are dropped
+                logger.debug("Order update: {} {} status={} volume_left={} is_dead={} "
+                             "exchange_id={} exchange_order_id={}",
+                             order_id, event_type, order.status, order.volume_left,
+                             update['is_dead'], update['exchange_id'],
+                             update['exchange_order_id'])
+                updates.append(update)
+                snapshots.append((order_id, current_state))
+
+        if not updates:
+            return
+
+        # Commit the snapshots only once the batch actually went out, so a
+        # failed publish is re-detected and re-sent on the next tick
+        if on_updates(updates):
+            for order_id, state in snapshots:
+                self.previous_orders[order_id] = state
 
     def _determine_event_type(self, order) -> str:
         """Determine event type based on order state"""
-        if order.status == "FINISHED":
-            if order.volume_left == 0:
-                return "COMPLETE_FILL"
-            else:
-                return "CANCELED"
-        elif order.status == "ALIVE":
-            if order.volume_left < order.volume_orign:
-                return "PARTIAL_FILL"
-            else:
-                return "NEW"
-        return order.status
+        key = (order.status, order.volume_left == 0,
+               order.volume_left < order.volume_orign)
+        return _EVENT_TYPES.get(key, order.status)
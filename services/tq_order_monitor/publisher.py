@@ -1,19 +1,30 @@
 """
 RabbitMQ publisher for order updates
 """
-from typing import Dict, Any
+import queue
+import threading
+import time
+from typing import Dict, Any, List
 from loguru import logger
 
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
-
 from shared.config import Config
 from shared.constants import INTERNAL_EXCHANGE, ROUTING_KEY_ORDER_UPDATES
 from shared.rabbitmq_client import RabbitMQPublisher
 
 
 class OrderUpdatePublisher:
-    """Publisher for order updates to internal queue"""
+    """
+    Publisher for order updates to internal queue.
+
+    publish/publish_many only enqueue: a background drain thread batches
+    updates and talks to RabbitMQ, so broker RTT or a reconnect never
+    blocks the TqApi thread running the monitor loop.
+    """
+
+    QUEUE_MAX = 2048
+    BATCH_MAX = 64
+    BATCH_WINDOW = 0.05
+    DROP_WARN_INTERVAL = 5.0
 
     def __init__(self, config: Config):
         self.publisher = RabbitMQPublisher(
@@ -23,14 +34,70 @@ class OrderUpdatePublisher:
         )
         self.publisher.connect()
 
-    def publish(self, update: Dict[str, Any]):
-        """Publish order update to internal queue"""
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_MAX)
+        self._running = True
+        self._last_drop_warn = 0.0
+        self._drain_thread = threading.Thread(
+            target=self._drain_loop,
+            name="order-update-publisher",
+            daemon=True
+        )
+        self._drain_thread.start()
+
+    def publish(self, update: Dict[str, Any]) -> bool:
+        """Enqueue an order update; never blocks the caller"""
         try:
-            self.publisher.publish(ROUTING_KEY_ORDER_UPDATES, update)
-            logger.debug(f"Published order update: {update.get('order_id')}")
-        except Exception as e:
-            logger.error(f"Failed to publish order update: {e}")
+            self._queue.put_nowait(update)
+            return True
+        except queue.Full:
+            now = time.monotonic()
+            if now - self._last_drop_warn >= self.DROP_WARN_INTERVAL:
+                logger.warning("Order update queue full, dropping updates")
+                self._last_drop_warn = now
+            return False
+
+    def publish_many(self, updates: List[Dict[str, Any]]) -> bool:
+        """
+        Enqueue a tick's order updates.
+
+        Returns True only if every update was accepted, so the monitor
+        keeps its change snapshots and re-sends on the next tick after a
+        full queue.
+        """
+        accepted = True
+        for update in updates:
+            if not self.publish(update):
+                accepted = False
+        return accepted
+
+    def _drain_loop(self):
+        """Drain queued updates and publish them in batches"""
+        while self._running or not self._queue.empty():
+            try:
+                update = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            batch = [update]
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self.publisher.publish_batch(ROUTING_KEY_ORDER_UPDATES, batch)
+                logger.debug(f"Published {len(batch)} order update(s)")
+            except Exception as e:
+                logger.error(f"Failed to publish order updates: {e}")
 
     def close(self):
-        """Close publisher connection"""
+        """Stop the drain thread and close the publisher connection"""
+        self._running = False
+        if self._drain_thread.is_alive():
+            self._drain_thread.join(timeout=5)
         self.publisher.close()
@@ -4,17 +4,17 @@ CLOSETODAY order splitting logic for SHFE/INE exchanges
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
-
 from shared.constants import CLOSETODAY_EXCHANGES
 from shared.redis_client import RedisClient
 
+# startswith against a tuple of prefixes is a single C-level check per
+# order, with no list allocation from split('.')
+_CLOSETODAY_PREFIXES = tuple(f"{exchange}." for exchange in sorted(CLOSETODAY_EXCHANGES))
+
 
 def requires_closetoday(symbol: str) -> bool:
     """Check if symbol requires CLOSETODAY handling"""
-    exchange = symbol.split('.')[0] if '.' in symbol else ''
-    return exchange in CLOSETODAY_EXCHANGES
+    return symbol.startswith(_CLOSETODAY_PREFIXES)
 
 
 def split_close_order(
@@ -36,6 +36,46 @@ def split_close_order(
 
     # Get full position from Redis
     position = redis_client.get_full_position(portfolio_id, symbol)
+    return _split_with_position(order_request, position)
+
+
+def split_close_orders_batch(
+    order_requests: List[Dict[str, Any]],
+    redis_client: RedisClient,
+    portfolio_id: str
+) -> List[Dict[str, Any]]:
+    """
+    Split a batch of order requests with one Redis round trip.
+
+    Positions for every symbol that needs splitting are fetched in a
+    single pipeline, then each order runs the normal split logic.
+    """
+    need_split = [
+        order for order in order_requests
+        if order.get('offset') == 'CLOSE' and requires_closetoday(order.get('symbol', ''))
+    ]
+
+    positions: Dict[str, Any] = {}
+    if need_split:
+        symbols = list({order['symbol'] for order in need_split})
+        positions = redis_client.get_full_positions(portfolio_id, symbols)
+
+    results: List[Dict[str, Any]] = []
+    for order in order_requests:
+        if order.get('offset') == 'CLOSE' and requires_closetoday(order.get('symbol', '')):
+            results.extend(_split_with_position(order, positions.get(order['symbol'])))
+        else:
+            results.append(order)
+    return results
+
+
+def _split_with_position(
+    order_request: Dict[str, Any],
+    position: Optional[Any]
+) -> List[Dict[str, Any]]:
+    """Split one CLOSE order against an already-fetched position"""
+    symbol = order_request.get('symbol', '')
+
     if not position:
         logger.warning(f"No position found for {symbol}, using original CLOSE")
         return [order_request]
@@ -55,25 +95,28 @@ def split_close_order(
     orders = []
     remaining = volume
 
-    # CLOSETODAY first (close today's positions)
+    # CLOSETODAY first (close today's positions); the dict-merge literal
+    # builds the derived order in one C-level pass instead of copy+mutate
     if today_qty > 0 and remaining > 0:
         closetoday_vol = min(today_qty, remaining)
-        closetoday_order = order_request.copy()
-        closetoday_order['offset'] = 'CLOSETODAY'
-        closetoday_order['volume'] = closetoday_vol
-        closetoday_order['order_id'] = f"{base_order_id}_closetoday"
-        orders.append(closetoday_order)
+        orders.append({
+            **order_request,
+            'offset': 'CLOSETODAY',
+            'volume': closetoday_vol,
+            'order_id': f"{base_order_id}_closetoday"
+        })
         remaining -= closetoday_vol
         logger.info(f"Split CLOSETODAY order: {symbol} {direction} {closetoday_vol}")
 
     # Then CLOSE for historical positions
     if his_qty > 0 and remaining > 0:
         close_vol = min(his_qty, remaining)
-        close_order = order_request.copy()
-        close_order['offset'] = 'CLOSE'
-        close_order['volume'] = close_vol
-        close_order['order_id'] = f"{base_order_id}_close"
-        orders.append(close_order)
+        orders.append({
+            **order_request,
+            'offset': 'CLOSE',
+            'volume': close_vol,
+            'order_id': f"{base_order_id}_close"
+        })
         logger.info(f"Split CLOSE order: {symbol} {direction} {close_vol}")
 
     if not orders:
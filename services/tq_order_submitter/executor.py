@@ -2,134 +2,291 @@
 TqApi order execution logic
 """
 import time
-import pandas as pd
-from typing import Dict, Any
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, Any, NamedTuple
+from zoneinfo import ZoneInfo
 from loguru import logger
 from tqsdk import TqApi
 
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
 from shared.constants import ORDER_EXPIRE_ALLOW_MAX
 
 SESSION_END_BUFFER_SECONDS = 15
 
+# Age limit in integer nanoseconds: the hot-path age check stays on int64
+# subtraction and compare, no float division or boxing
+_MAX_AGE_NS = int(ORDER_EXPIRE_ALLOW_MAX * 1_000_000_000)
 
-def is_in_trading_session(order_id):
-    """Check if current time is within trading hours and not too close to session end."""
-    now = pd.Timestamp.now(tz='Asia/Shanghai')
-    current_time = now.time()
+# Stdlib tzinfo built once at import: datetime.now(_TZ) skips the pandas
+# Timestamp machinery and any per-call localize cost on the order path
+_TZ = ZoneInfo("Asia/Shanghai")
 
-    sessions = [
-        (pd.Timestamp('09:00:00').time(), pd.Timestamp('10:15:00').time()),
-        (pd.Timestamp('10:30:00').time(), pd.Timestamp('11:30:00').time()),
-        (pd.Timestamp('13:30:00').time(), pd.Timestamp('15:00:00').time())
-    ]
+# Session bounds as seconds since midnight, built once: the per-order check
+# reduces to integer comparisons with no time-object allocations
+_SESSIONS = (
+    (9 * 3600, 10 * 3600 + 15 * 60),
+    (10 * 3600 + 30 * 60, 11 * 3600 + 30 * 60),
+    (13 * 3600 + 30 * 60, 15 * 3600)
+)
 
-    for start, end in sessions:
-        if start <= current_time <= end:
-            session_end_ts = pd.Timestamp.combine(now.date(), end).tz_localize('Asia/Shanghai')
-            seconds_remaining = (session_end_ts - now).total_seconds()
+# Flattened sorted bounds for bisect: landing on an odd index means t is
+# inside the session ending at _BOUNDS[idx], so the whole scan is one
+# C-level binary search
+_BOUNDS = tuple(bound for session in _SESSIONS for bound in session)
 
-            if seconds_remaining <= SESSION_END_BUFFER_SECONDS:
-                logger.warning(f"Order {order_id} rejected - {seconds_remaining:.0f}s to session end")
-                return False
+# Last verdict as (monotonic deadline, verdict): consecutive orders in a
+# burst reuse it for up to 250ms, never cached past the session-end buffer
+_VERDICT_TTL = 0.25
+_last_verdict = [0.0, False]
 
-            return True
 
-    logger.warning(f"Order {order_id} rejected - not in trading session")
-    return False
+class OrderReq(NamedTuple):
+    """
+    Order request decoded once from the message dict.
 
+    Attribute access is an offset load, so the rest of the submit path
+    stops paying a hash probe per field read.
+    """
+    symbol: str
+    direction: str
+    offset: str
+    volume: int
+    limit_price: float
+    order_id: str
+    portfolio_id: str
+    timestamp: int
 
-def check_order_age(order_request):
-    """Validate order age to prevent stale orders."""
-    order_id = order_request.get('order_id')
-    timestamp = order_request.get('timestamp')
+    @classmethod
+    def from_message(cls, message: Dict[str, Any], default_portfolio_id: str) -> 'OrderReq':
+        return cls(
+            symbol=message['symbol'],
+            direction=message['direction'],
+            offset=message['offset'],
+            volume=message['volume'],
+            limit_price=message.get('limit_price', 0.0),
+            order_id=message.get('order_id'),
+            portfolio_id=message.get('portfolio_id', default_portfolio_id),
+            timestamp=message.get('timestamp')
+        )
 
-    if not timestamp:
-        logger.warning(f"Order {order_id} rejected - missing timestamp")
-        return False
 
-    age = (time.time_ns() - timestamp) / 1e9
 
-    if age > ORDER_EXPIRE_ALLOW_MAX:
-        logger.warning(f"Order {order_id} rejected - {age:.3f}s old (max {ORDER_EXPIRE_ALLOW_MAX}s)")
+def is_in_trading_session(order_id, *, _monotonic=time.monotonic, _now=datetime.now,
+                          _tz=_TZ, _bisect=bisect_right, _bounds=_BOUNDS):
+    """
+    Check if current time is within trading hours and not too close to session end.
+
+    The keyword-only defaults pre-bind the invariant lookups so the hot
+    path runs on LOAD_FAST instead of module-global probes.
+    """
+    mono = _monotonic()
+    if mono < _last_verdict[0]:
+        if not _last_verdict[1]:
+            logger.warning(f"Order {order_id} rejected - outside trading session")
+        return _last_verdict[1]
+
+    now = _now(_tz)
+    t = now.hour * 3600 + now.minute * 60 + now.second
+
+    idx = _bisect(_bounds, t)
+    if not idx & 1:
+        _last_verdict[:] = (mono + _VERDICT_TTL, False)
+        logger.warning(f"Order {order_id} rejected - not in trading session")
         return False
 
-    logger.debug(f"Order {order_id} age check passed: {age:.3f}s")
+    seconds_remaining = _bounds[idx] - t
+    if seconds_remaining <= SESSION_END_BUFFER_SECONDS:
+        _last_verdict[:] = (mono + _VERDICT_TTL, False)
+        logger.warning(f"Order {order_id} rejected - {seconds_remaining:.0f}s to session end")
+        return False
+
+    _last_verdict[:] = (
+        mono + min(_VERDICT_TTL, seconds_remaining - SESSION_END_BUFFER_SECONDS),
+        True
+    )
     return True
 
 
-def execute_order(api: TqApi, db_writer, config, order_request: Dict[str, Any]) -> bool:
-    """Execute order via TqApi after validation checks and DB insert."""
-    try:
-        # check first
-        if not check_order_age(order_request):
-            return False
+def check_order_age(order_id, timestamp, *, _now_ns=time.time_ns, _max_age_ns=_MAX_AGE_NS):
+    """
+    Validate order age to prevent stale orders.
 
-        if not is_in_trading_session(order_request.get('order_id')):
-            return False
+    Returns the age in nanoseconds on pass, None on reject, so callers
+    can re-validate later without a second wall-clock read. Seconds are
+    only computed on the logging branches.
+    """
+    if not timestamp:
+        logger.warning(f"Order {order_id} rejected - missing timestamp")
+        return None
 
-        symbol = order_request['symbol']
-        direction = order_request['direction']
-        offset = order_request['offset']
-        volume = order_request['volume']
-        limit_price = order_request.get('limit_price', 0.0)
-        order_id = order_request.get('order_id')
-        portfolio_id = order_request.get('portfolio_id', config.portfolio_id)
-        timestamp = order_request['timestamp']
-
-        _print_price_str = f"{limit_price}" if limit_price else "MARKET"
-        logger.info(f"Submitting order: {symbol} {direction} {offset} {volume} @ {_print_price_str}")
-
-        # Prepare order data for DB insertion
-        from shared.models import OrderHistoryFuturesChn
-        order_data = OrderHistoryFuturesChn(
-            order_id=order_id,
-            instrument_id=symbol,  # Will be updated by monitor with TqSDK's instrument_id
-            direction=direction,
-            order_offset=offset,
-            volume_orign=volume,
-            volume_left=volume,
-            limit_price=limit_price if limit_price else 0.0,
-            qpto_portfolio_id=portfolio_id,
-            qpto_contract_code=symbol,
-            sender_type='tq_submitter',
-            origin_timestamp=timestamp
-        )
+    age_ns = _now_ns() - timestamp
 
-        # Insert to database BEFORE second validation
-        if not db_writer.insert_order(order_data):
-            logger.error(f"DB insert failed for order {order_id}, aborting submission")
-            return False
-        else:
-            logger.info(f"DB insert success for order {order_id}")
+    if age_ns > _max_age_ns:
+        logger.warning(f"Order {order_id} rejected - {age_ns / 1e9:.3f}s old "
+                       f"(max {ORDER_EXPIRE_ALLOW_MAX}s)")
+        return None
 
-        # before send, check again
-        if not check_order_age(order_request):
-            return False
+    # lazy=True defers even the ns-to-seconds division until a sink
+    # actually accepts DEBUG records
+    logger.opt(lazy=True).debug("Order {} age check passed: {:.3f}s",
+                                lambda: order_id, lambda: age_ns / 1e9)
+    return age_ns
 
-        if not is_in_trading_session(order_request.get('order_id')):
-            return False
 
-        # Prepare TqSDK order params
-        order_params = {
-            'symbol': symbol,
-            'direction': direction,
-            'offset': offset,
-            'volume': volume,
-            'order_id': order_id
-        }
+def _prepare_order(db_writer, config, order_request: Dict[str, Any]) -> OrderReq:
+    """
+    Validate an order request and persist it, returning the decoded request.
 
-        if limit_price:
-            order_params['limit_price'] = limit_price
+    Returns None when any validation or the DB insert fails.
+    """
+    # Decode the message once; everything after runs on attribute loads
+    checked = _decode_and_check(config, order_request)
+    if checked is None:
+        return None
+    req, age_ns, age_t0 = checked
+
+    # Insert to database BEFORE second validation
+    if not db_writer.insert_order(_build_order_row(req)):
+        logger.error(f"DB insert failed for order {req.order_id}, aborting submission")
+        return None
+    else:
+        logger.info(f"DB insert success for order {req.order_id}")
+
+    if not _recheck(req, age_ns, age_t0):
+        return None
+
+    return req
+
+
+def _decode_and_check(config, order_request: Dict[str, Any]):
+    """
+    Decode one message and run the first round of validations.
+
+    Returns (req, age_ns, monotonic_t0) on pass, None on reject; the age
+    and clock mark let _recheck re-validate without a wall-clock read.
+    """
+    req = OrderReq.from_message(order_request, config.portfolio_id)
+
+    age_ns = check_order_age(req.order_id, req.timestamp)
+    if age_ns is None or not is_in_trading_session(req.order_id):
+        return None
+
+    logger.info("Submitting order: {} {} {} {} @ {}",
+                req.symbol, req.direction, req.offset, req.volume,
+                req.limit_price or "MARKET")
+    return req, age_ns, time.monotonic_ns()
+
+
+def _build_order_row(req: OrderReq):
+    """Build the order row for DB insertion"""
+    from shared.models import OrderHistoryFuturesChn
+    return OrderHistoryFuturesChn(
+        order_id=req.order_id,
+        instrument_id=req.symbol,  # Will be updated by monitor with TqSDK's instrument_id
+        direction=req.direction,
+        order_offset=req.offset,
+        volume_orign=req.volume,
+        volume_left=req.volume,
+        limit_price=req.limit_price if req.limit_price else 0.0,
+        qpto_portfolio_id=req.portfolio_id,
+        qpto_contract_code=req.symbol,
+        sender_type='tq_submitter',
+        origin_timestamp=req.timestamp
+    )
+
+
+def _recheck(req: OrderReq, age_ns: int, age_t0: int) -> bool:
+    """
+    Re-validate before the send: advance the first age by the monotonic
+    elapsed instead of re-reading the wall clock, so an NTP step during
+    the DB insert cannot skew the verdict.
+    """
+    if age_ns + time.monotonic_ns() - age_t0 > _MAX_AGE_NS:
+        logger.warning(f"Order {req.order_id} rejected - expired during DB insert")
+        return False
+    return is_in_trading_session(req.order_id)
+
+
+def _submit(insert_order, req: OrderReq):
+    """
+    Send one prepared request through a pre-bound insert_order.
+
+    The two call shapes the system ever submits (limit / market) are
+    spelled out with explicit keywords, so there is no params dict to
+    build or ** unpack per order.
+    """
+    if req.limit_price:
+        return insert_order(symbol=req.symbol, direction=req.direction,
+                            offset=req.offset, volume=req.volume,
+                            limit_price=req.limit_price, order_id=req.order_id)
+    return insert_order(symbol=req.symbol, direction=req.direction,
+                        offset=req.offset, volume=req.volume,
+                        order_id=req.order_id)
+
+
+def execute_order(api: TqApi, db_writer, config, order_request: Dict[str, Any]) -> bool:
+    """Execute order via TqApi after validation checks and DB insert."""
+    try:
+        req = _prepare_order(db_writer, config, order_request)
+        if req is None:
+            return False
 
         api.wait_update()
-        api.insert_order(**order_params)
-        api.wait_update()
+        _submit(api.insert_order, req)
 
-        logger.info(f"Order {order_id} submitted successfully")
+        logger.info(f"Order {req.order_id} submitted successfully")
         return True
 
     except Exception as e:
         logger.error(f"Order execution failed: {e}")
         return False
+
+
+def execute_orders(api: TqApi, db_writer, config, order_requests: list) -> bool:
+    """
+    Execute a batch of orders without blocking on the broker.
+
+    insert_order only queues the request locally; the service loop's next
+    wait_update flushes the whole batch to the broker, so N orders add no
+    blocking round trip here at all. The DB inserts for the batch go
+    through one transaction via insert_orders.
+    """
+    success = True
+
+    candidates = []
+    for order_request in order_requests:
+        try:
+            checked = _decode_and_check(config, order_request)
+        except Exception as e:
+            logger.error(f"Order execution failed: {e}")
+            success = False
+            continue
+        if checked is None:
+            success = False
+            continue
+        candidates.append(checked)
+
+    if not candidates:
+        return success
+
+    # One transaction and one round trip for every row in the batch
+    rows = [_build_order_row(req) for req, _, _ in candidates]
+    if not db_writer.insert_orders(rows):
+        logger.error(f"DB batch insert failed for {len(rows)} order(s), aborting batch")
+        return False
+    logger.info(f"DB insert success for {len(rows)} order(s)")
+
+    insert_order = api.insert_order
+    for req, age_ns, age_t0 in candidates:
+        try:
+            if not _recheck(req, age_ns, age_t0):
+                success = False
+                continue
+
+            _submit(insert_order, req)
+            logger.info(f"Order {req.order_id} submitted successfully")
+        except Exception as e:
+            logger.error(f"Order execution failed: {e}")
+            success = False
+
+    return success
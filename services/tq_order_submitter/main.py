@@ -6,13 +6,15 @@ Consumes SUBMIT order requests from external RabbitMQ and executes via TqApi.
 Handles CLOSETODAY splitting for SHFE/INE exchanges.
 """
 import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+from functools import partial
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from shared.aiopika_tqapi_base import AioPikaTqApiService
 from shared.redis_client import RedisClient
 from shared.constants import EXTERNAL_ORDER_SUBMIT_QUEUE, EXTERNAL_ORDER_EXCHANGE
 
-from worker import process_order_submit
+from worker import process_order_submit, process_order_submits
 from order_db_writer import OrderDbWriter
 
 
@@ -35,6 +37,12 @@ class OrderSubmitterService(AioPikaTqApiService):
     def initialize_worker_resources(self):
         self.redis_client = RedisClient(self.config)
         self.db_writer = OrderDbWriter(self.config)
+        # Bind the worker entry points once: the per-message dispatch then
+        # skips re-reading api/redis/db/config attributes on self each call
+        self.process_message_in_worker = partial(
+            process_order_submit, self.api, self.redis_client, self.db_writer, self.config)
+        self.process_messages_in_worker = partial(
+            process_order_submits, self.api, self.redis_client, self.db_writer, self.config)
 
     def cleanup_worker_resources(self):
         if self.redis_client:
@@ -45,6 +53,9 @@ class OrderSubmitterService(AioPikaTqApiService):
     def process_message_in_worker(self, message: dict) -> bool:
         return process_order_submit(self.api, self.redis_client, self.db_writer, self.config, message)
 
+    def process_messages_in_worker(self, messages: list) -> bool:
+        return process_order_submits(self.api, self.redis_client, self.db_writer, self.config, messages)
+
 
 if __name__ == "__main__":
     service = OrderSubmitterService()
@@ -1,76 +1,81 @@
 """
 Database writer for order insertion (submit service)
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 from loguru import logger
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+from sqlalchemy import text
 
 from shared.config import Config
+from shared.db import get_engine
 from shared.models import OrderHistoryFuturesChn
 
+# Built once at import: reusing the same text() object lets SQLAlchemy hit
+# its compiled-statement cache on every insert instead of re-lexing the SQL
+_INSERT_ORDER_SQL = text("""
+    INSERT INTO order_history_futures_chn (
+        order_id, exchange_order_id, exchange_id, instrument_id,
+        direction, order_offset, volume_orign, volume_left, limit_price,
+        price_type, volume_condition, time_condition, insert_date_time,
+        last_msg, status, is_dead, is_online, is_error, trade_price,
+        qpto_portfolio_id, qpto_contract_code, sender_type,
+        qpto_order_tag, qpto_trading_date, exchange_trading_date,
+        origin_timestamp
+    ) VALUES (
+        :order_id, :exchange_order_id, :exchange_id, :instrument_id,
+        :direction, :order_offset, :volume_orign, :volume_left, :limit_price,
+        :price_type, :volume_condition, :time_condition, :insert_date_time,
+        :last_msg, :status, :is_dead, :is_online, :is_error, :trade_price,
+        :qpto_portfolio_id, :qpto_contract_code, :sender_type,
+        :qpto_order_tag, :qpto_trading_date, :exchange_trading_date,
+        :origin_timestamp
+    )
+""")
+
 
 class OrderDbWriter:
     """Writer for order insertion with connection pooling"""
 
     def __init__(self, config: Config):
         self.config = config
-        db_config = config.database
-        db_url = f"postgresql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['dbname']}"
-        self.engine = create_engine(
-            db_url,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
-            pool_recycle=3600
-        )
-        self.Session = sessionmaker(bind=self.engine)
+        # Process-wide engine shared with any other writer in this process,
+        # so a single pool serves both instead of two half-idle ones
+        self.engine = get_engine(config)
         logger.info("OrderDbWriter initialized with connection pool")
 
     def insert_order(self, order_data: OrderHistoryFuturesChn) -> bool:
         """Insert new order into database"""
-        session = self.Session()
-        try:
-            insert_sql = text("""
-                INSERT INTO order_history_futures_chn (
-                    order_id, exchange_order_id, exchange_id, instrument_id,
-                    direction, order_offset, volume_orign, volume_left, limit_price,
-                    price_type, volume_condition, time_condition, insert_date_time,
-                    last_msg, status, is_dead, is_online, is_error, trade_price,
-                    qpto_portfolio_id, qpto_contract_code, sender_type,
-                    qpto_order_tag, qpto_trading_date, exchange_trading_date,
-                    origin_timestamp
-                ) VALUES (
-                    :order_id, :exchange_order_id, :exchange_id, :instrument_id,
-                    :direction, :order_offset, :volume_orign, :volume_left, :limit_price,
-                    :price_type, :volume_condition, :time_condition, :insert_date_time,
-                    :last_msg, :status, :is_dead, :is_online, :is_error, :trade_price,
-                    :qpto_portfolio_id, :qpto_contract_code, :sender_type,
-                    :qpto_order_tag, :qpto_trading_date, :exchange_trading_date,
-                    :origin_timestamp
-                )
-            """)
+        return self.insert_orders([order_data])
+
+    def insert_orders(self, orders: List[OrderHistoryFuturesChn]) -> bool:
+        """
+        Insert a batch of orders in one transaction.
 
-            order_dict = order_data.to_dict()
-            # Remove trade_records from dict as it's not a table column
-            order_dict.pop('trade_records', None)
-            session.execute(insert_sql, order_dict)
+        The whole batch goes through one executemany (folded into VALUES
+        pages by the engine) and one commit. engine.begin() checks out a
+        pooled connection directly - plain Core SQL needs no ORM Session
+        lifecycle (identity map, flush bookkeeping) per call.
+        """
+        if not orders:
+            return True
+
+        try:
+            rows = []
+            for order_data in orders:
+                row = order_data.to_dict()
+                # Remove trade_records from dict as it's not a table column
+                row.pop('trade_records', None)
+                rows.append(row)
 
-            session.commit()
-            logger.debug(f"Order inserted to DB: {order_data.order_id}")
+            with self.engine.begin() as conn:
+                conn.execute(_INSERT_ORDER_SQL, rows)
+            logger.debug("{} order(s) inserted to DB", len(rows))
             return True
 
         except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to insert order to DB: {e}")
+            logger.error(f"Failed to insert orders to DB: {e}")
             return False
-        finally:
-            session.close()
 
     def close(self):
         """Close database connection pool"""
-        self.engine.dispose()
-        logger.info("OrderDbWriter connection pool closed")
+        # The shared engine is disposed at process exit by shared.db
+        logger.info("OrderDbWriter closed")
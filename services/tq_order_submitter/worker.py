@@ -2,19 +2,51 @@
 Order submission worker logic
 Runs in worker thread, processes messages with validation
 """
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
 
 from loguru import logger
 from tqsdk import TqApi
 
 from shared.redis_client import RedisClient
 from shared.config import Config
-from closetoday_splitter import split_close_order
-from executor import execute_order
+from closetoday_splitter import split_close_order, split_close_orders_batch
+from executor import check_order_age, execute_orders, is_in_trading_session
 from order_db_writer import OrderDbWriter
 
 
+def process_order_submits(api: TqApi, redis_client: RedisClient, db_writer: OrderDbWriter,
+                          config: Config, messages: list) -> bool:
+    """
+    Process a batch of order submit requests.
+
+    All CLOSETODAY splitting for the batch happens with one Redis round
+    trip, then all orders are submitted behind one wait_update barrier.
+    """
+    try:
+        submits = [m for m in messages if m.get('action') != 'CANCEL']
+        if not submits:
+            return True
+
+        # Cheap checks before the Redis split: out of session rejects the
+        # whole batch, and stale messages drop without any position lookup
+        if not is_in_trading_session(submits[0].get('order_id')):
+            return False
+
+        fresh = [
+            m for m in submits
+            if check_order_age(m.get('order_id'), m.get('timestamp')) is not None
+        ]
+        if not fresh:
+            return False
+
+        orders = split_close_orders_batch(fresh, redis_client, config.portfolio_id)
+        ok = execute_orders(api, db_writer, config, orders)
+        return ok and len(fresh) == len(submits)
+
+    except Exception as e:
+        logger.error(f"Error processing order batch: {e}")
+        return False
+
+
 def process_order_submit(api: TqApi, redis_client: RedisClient, db_writer: OrderDbWriter,
                         config: Config, message: dict) -> bool:
     """
@@ -30,16 +62,19 @@ def process_order_submit(api: TqApi, redis_client: RedisClient, db_writer: Order
 
         logger.info(f"Processing order: {message}")
 
+        # Cheap checks first: a stale or out-of-session order never pays
+        # for the Redis position lookup in the splitter
+        if check_order_age(message.get('order_id'), message.get('timestamp')) is None:
+            return False
+        if not is_in_trading_session(message.get('order_id')):
+            return False
+
         # Split CLOSETODAY orders for SHFE/INE exchanges
         orders = split_close_order(message, redis_client, config.portfolio_id)
 
-        # Execute all orders
-        success = True
-        for order in orders:
-            if not execute_order(api, db_writer, config, order):
-                success = False
-
-        return success
+        # Execute all legs behind one wait_update barrier; a CLOSETODAY
+        # split would otherwise pay two waits per leg
+        return execute_orders(api, db_writer, config, orders)
 
     except Exception as e:
         logger.error(f"Error processing order: {e}")
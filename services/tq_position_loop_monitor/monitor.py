@@ -2,11 +2,8 @@
 Loop-based position monitoring for reconciliation and universe tracking.
 Runs every 5 seconds, compares TqApi positions with Redis.
 """
-import sys
 import time
 
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
-
 from loguru import logger
 from tqsdk import TqApi
 
@@ -62,46 +59,52 @@ class PositionLoopMonitor:
 
         # Get universe symbols (main + next contracts)
         universe_symbols = self.universe_loader.load_universe()
-        processed_symbols = set()
 
         # Get current positions from TqApi
         tq_positions = self.api.get_position()
-
-        # Process all TqApi positions
-        for symbol, pos in tq_positions.items():
-            tq_position = FullPosition.from_tqsdk_position(pos)
-            self._reconcile_position(symbol, tq_position)
-            processed_symbols.add(symbol)
-
-        # Ensure universe symbols exist (initialize with zero if not in TqApi)
-        for symbol in universe_symbols:
-            if symbol not in processed_symbols:
-                self._ensure_position_exists(symbol)
-
-    def _reconcile_position(self, symbol: str, tq_position: FullPosition):
-        """Reconcile a single position with Redis"""
-        redis_position = self.redis.get_full_position(self.portfolio_id, symbol)
-
-        if redis_position is None:
-            # Not in Redis - set it
-            self.redis.set_full_position(self.portfolio_id, symbol, tq_position)
-            logger.info(f"Initialized position: {symbol} pos={tq_position.pos}")
-        elif tq_position.equals(redis_position):
-            # Same - just refresh TTL
-            self.redis.refresh_position_ttl(self.portfolio_id, symbol)
-            logger.info(f"Position TTL refreshed: {symbol}")
-        else:
-            # Mismatch - log warning
-            logger.warning(f"Position mismatch for {symbol}: TqApi={tq_position.pos}, Redis={redis_position.pos}")
-
-    def _ensure_position_exists(self, symbol: str):
-        """Ensure a universe symbol has a position entry (zero if not held)"""
-        redis_position = self.redis.get_full_position(self.portfolio_id, symbol)
-
-        if redis_position is None:
-            # Initialize with zero position
-            self.redis.set_full_position(self.portfolio_id, symbol, FullPosition.zero())
-            logger.info(f"Initialized zero position for universe symbol: {symbol}")
-        else:
-            # Exists - just refresh TTL
-            self.redis.refresh_position_ttl(self.portfolio_id, symbol)
+        tq_current = {
+            symbol: FullPosition.from_tqsdk_position(pos)
+            for symbol, pos in tq_positions.items()
+        }
+
+        # Universe symbols not held in TqApi still need a (zero) entry;
+        # one C-level set difference instead of a per-symbol membership loop
+        extra_symbols = set(universe_symbols) - tq_current.keys()
+
+        # One pipelined read for the whole cycle instead of a GET per symbol
+        redis_positions = self.redis.get_full_positions(
+            self.portfolio_id, list(tq_current) + list(extra_symbols))
+
+        to_set = {}
+        to_refresh = []
+
+        for symbol, tq_position in tq_current.items():
+            redis_position = redis_positions.get(symbol)
+            if redis_position is None:
+                # Not in Redis - set it
+                to_set[symbol] = tq_position
+                logger.debug("Initialized position: {} pos={}", symbol, tq_position.pos)
+            elif tq_position.equals(redis_position):
+                # Same - just refresh TTL
+                to_refresh.append(symbol)
+            else:
+                # Mismatch - log warning
+                logger.warning(f"Position mismatch for {symbol}: TqApi={tq_position.pos}, Redis={redis_positions[symbol].pos}")
+
+        for symbol in extra_symbols:
+            if redis_positions.get(symbol) is None:
+                # Initialize with zero position
+                to_set[symbol] = FullPosition.zero()
+                logger.debug("Initialized zero position for universe symbol: {}", symbol)
+            else:
+                # Exists - just refresh TTL
+                to_refresh.append(symbol)
+
+        # Flush all writes and TTL refreshes in one pipelined round trip each
+        if to_set:
+            self.redis.set_full_positions(self.portfolio_id, to_set)
+        if to_refresh:
+            self.redis.refresh_position_ttls(self.portfolio_id, to_refresh)
+
+        # One aggregate INFO line per cycle; per-symbol detail is DEBUG
+        logger.info("Reconciliation: {} set, {} refreshed", len(to_set), len(to_refresh))
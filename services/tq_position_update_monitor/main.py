@@ -5,91 +5,60 @@ TQ Position Update Monitor Service
 Event-driven position monitoring via TqApi.wait_update().
 Writes position updates directly to Redis.
 """
-import signal
 import sys
+from pathlib import Path
 
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from loguru import logger
 from tqsdk import TqApi
 
-from shared.config import get_config
+from shared.base_service import BaseService
 from shared.tqapi_factory import create_tqapi, close_tqapi
 from shared.redis_client import RedisClient
 
 from monitor import PositionUpdateMonitor
 
 
-class PositionUpdateMonitorService:
+class PositionUpdateMonitorService(BaseService):
     """Position Update Monitor Service - event-driven with direct Redis writes"""
 
     def __init__(self):
-        self.config = get_config()
+        super().__init__()
         self.api: TqApi = None
         self.redis_client: RedisClient = None
         self.monitor: PositionUpdateMonitor = None
 
-    def setup_logging(self):
-        logger.remove()
-        logger.add(
-            sys.stdout,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>pos_update_monitor</cyan> - <level>{message}</level>",
-            level="INFO",
-            colorize=True
-        )
-        logger.add(
-            "logs/tq_position_update_monitor.log",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | pos_update_monitor - {message}",
-            level="INFO",
-            rotation="10 MB",
-            retention="7 days"
+    def get_service_name(self) -> str:
+        return "position_update_monitor"
+
+    def init_resources(self):
+        logger.info("Initializing Redis client...")
+        self.redis_client = RedisClient(self.config)
+
+        logger.info("Initializing TqApi...")
+        self.api = create_tqapi(self.config)
+
+        logger.info("Initializing monitor...")
+        self.monitor = PositionUpdateMonitor(
+            self.api,
+            self.config.portfolio_id,
+            self.redis_client
         )
 
-    def signal_handler(self, signum, frame):
-        logger.info(f"Received signal {signum}, shutting down...")
+    def start(self):
+        logger.info("Starting position update monitoring...")
+        self.monitor.start()
+
+    def stop(self):
         if self.monitor:
             self.monitor.stop()
 
-    def run(self):
-        self.setup_logging()
-        logger.info("=" * 50)
-        logger.info("Starting TQ Position Update Monitor Service")
-        logger.info("=" * 50)
-
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
-
-        try:
-            logger.info("Initializing Redis client...")
-            self.redis_client = RedisClient(self.config)
-
-            logger.info("Initializing TqApi...")
-            self.api = create_tqapi(self.config)
-
-            logger.info("Initializing monitor...")
-            self.monitor = PositionUpdateMonitor(
-                self.api,
-                self.config.portfolio_id,
-                self.redis_client
-            )
-
-            logger.info("Starting position update monitoring...")
-            self.monitor.start()
-
-        except KeyboardInterrupt:
-            logger.info("Keyboard interrupt received")
-        except Exception as e:
-            logger.error(f"Fatal error: {e}", exc_info=True)
-        finally:
-            self.shutdown()
-
-    def shutdown(self):
-        logger.info("Shutting down...")
+    def cleanup_resources(self):
         if self.api:
             close_tqapi(self.api)
         if self.redis_client:
             self.redis_client.close()
-        logger.info("Shutdown complete")
 
 
 if __name__ == "__main__":
@@ -2,10 +2,8 @@
 Event-driven position monitoring using TqApi wait_update().
 Writes directly to Redis on each position change.
 """
-import sys
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
 
-from typing import Dict
+from typing import Dict, Tuple
 from loguru import logger
 from tqsdk import TqApi
 
@@ -13,6 +11,25 @@ from shared.redis_client import RedisClient
 from shared.models import FullPosition
 
 
+def _snapshot(pos) -> Tuple[int, int, int, int, int, int]:
+    """Read the six position fields once into a flat tuple"""
+    return (int(pos.pos_long), int(pos.pos_short), int(pos.pos_long_today),
+            int(pos.pos_long_his), int(pos.pos_short_today), int(pos.pos_short_his))
+
+
+def _to_full_position(snap: Tuple[int, int, int, int, int, int]) -> FullPosition:
+    """Build the Redis payload from an already-read snapshot"""
+    return FullPosition(
+        pos_long=snap[0],
+        pos_short=snap[1],
+        pos=snap[0] - snap[1],
+        pos_long_today=snap[2],
+        pos_long_his=snap[3],
+        pos_short_today=snap[4],
+        pos_short_his=snap[5]
+    )
+
+
 class PositionUpdateMonitor:
     """Event-driven monitor that writes position updates directly to Redis"""
 
@@ -20,7 +37,9 @@ class PositionUpdateMonitor:
         self.api = api
         self.portfolio_id = portfolio_id
         self.redis = redis_client
-        self.previous_positions: Dict[str, FullPosition] = {}
+        # Snapshot per symbol as a flat tuple: one C-level equality check
+        # against the previous tick instead of a field-by-field method call
+        self.previous_positions: Dict[str, Tuple[int, int, int, int, int, int]] = {}
         self.running = False
 
     def start(self):
@@ -45,25 +64,53 @@ class PositionUpdateMonitor:
         """Check and write any position changes to Redis"""
         positions = self.api.get_position()
         current_symbols = set()
+        changed: Dict[str, Tuple[int, int, int, int, int, int]] = {}
+        is_changing = self.api.is_changing
+        previous_positions = self.previous_positions
 
         for symbol, pos in positions.items():
             current_symbols.add(symbol)
-            current = FullPosition.from_tqsdk_position(pos)
+            # Known symbols untouched by this wait_update() tick skip the
+            # snapshot read entirely: O(changed) work instead of O(held)
+            if symbol in previous_positions and not is_changing(pos):
+                continue
+            current = _snapshot(pos)
             previous = self.previous_positions.get(symbol)
 
-            # Write if changed (force update)
-            if previous is None or not current.equals(previous):
-                self.redis.set_full_position(self.portfolio_id, symbol, current)
+            # Collect if changed (force update); per-symbol detail goes to
+            # DEBUG with deferred {} formatting so the hot path builds no
+            # strings when the sink level is INFO
+            if current != previous:
+                changed[symbol] = current
                 if previous is None:
-                    logger.info(f"Position init: {symbol} pos={current.pos}")
+                    logger.debug("Position init: {} pos={}",
+                                 symbol, current[0] - current[1])
                 else:
-                    logger.info(f"Position update: {symbol} pos={previous.pos} -> {current.pos}")
-                self.previous_positions[symbol] = current
+                    logger.debug("Position update: {} pos={} -> {}",
+                                 symbol, previous[0] - previous[1],
+                                 current[0] - current[1])
 
         # Handle closed positions (went to zero or disappeared)
-        for symbol in list(self.previous_positions.keys()):
-            if symbol not in current_symbols:
-                zero_pos = FullPosition.zero()
-                self.redis.set_full_position(self.portfolio_id, symbol, zero_pos)
-                logger.info(f"Position closed: {symbol}")
-                del self.previous_positions[symbol]
+        closed = [symbol for symbol in self.previous_positions
+                  if symbol not in current_symbols]
+
+        if not changed and not closed:
+            return
+
+        # FullPosition payloads are only built for symbols that actually
+        # changed this tick, not for every held symbol
+        writes = {symbol: _to_full_position(snap) for symbol, snap in changed.items()}
+        for symbol in closed:
+            writes[symbol] = FullPosition.zero()
+            logger.debug("Position closed: {}", symbol)
+
+        # All changes of this tick go out in one pipelined round trip; on
+        # failure previous_positions is untouched and the next tick retries
+        self.redis.set_full_positions(self.portfolio_id, writes)
+
+        # One aggregate INFO line per tick that wrote anything
+        logger.info("Position tick: {} changed, {} closed", len(changed), len(closed))
+
+        self.previous_positions.update(changed)
+        for symbol in closed:
+            del self.previous_positions[symbol]
@@ -7,20 +7,29 @@ import threading
 import queue
 import signal
 import sys
-import json
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional
-import pandas as pd
+from zoneinfo import ZoneInfo
 
 from loguru import logger
 from tqsdk import TqApi
 import aio_pika
+import orjson
 
 from shared.config import get_config
 from shared.tqapi_factory import create_tqapi, close_tqapi
 
+# Trading windows in minutes since midnight, built once: the health check
+# stays on integer compares with no pandas Timestamp per call
+_TZ_SHANGHAI = ZoneInfo("Asia/Shanghai")
+_TRADING_WINDOWS = (
+    (9 * 60, 10 * 60 + 15),
+    (10 * 60 + 30, 11 * 60 + 30),
+    (13 * 60 + 30, 15 * 60)
+)
+
 
 class AioPikaTqApiService(ABC):
 
@@ -66,17 +75,25 @@ class AioPikaTqApiService(ABC):
         """Return True for ACK, False for NACK"""
         pass
 
-    def _in_trading_time(self) -> bool:
-        now_ts = pd.Timestamp.now(tz="Asia/Shanghai")
-        time_in_minutes = now_ts.hour * 60 + now_ts.minute
+    def process_messages_in_worker(self, messages: list) -> bool:
+        """
+        Process all messages drained in one wait_update tick.
+
+        Default falls back to the per-message hook; services that can
+        amortize work across a batch override this instead.
+        """
+        success = True
+        for message in messages:
+            if not self.process_message_in_worker(message):
+                success = False
+        return success
 
-        morning_1 = (9 * 60, 10 * 60 + 15)
-        morning_2 = (10 * 60 + 30, 11 * 60 + 30)
-        afternoon = (13 * 60 + 30, 15 * 60)
+    def _in_trading_time(self) -> bool:
+        now = datetime.now(_TZ_SHANGHAI)
+        time_in_minutes = now.hour * 60 + now.minute
 
-        return (morning_1[0] <= time_in_minutes <= morning_1[1] or
-                morning_2[0] <= time_in_minutes <= morning_2[1] or
-                afternoon[0] <= time_in_minutes <= afternoon[1])
+        return any(start <= time_in_minutes <= end
+                   for start, end in _TRADING_WINDOWS)
 
     def tqapi_worker_loop(self):
         logger.info("Worker thread starting...")
@@ -107,18 +124,21 @@ class AioPikaTqApiService(ABC):
                 if block_counter > self.block_counter_max:
                     raise Exception(f"Too many TqSDK timeouts, shutting down")
 
+                messages = []
                 while not self.message_queue.empty():
                     try:
-                        message = self.message_queue.get_nowait()
-                        logger.info("Processing message from queue")
-                        try:
-                            success = self.process_message_in_worker(message)
-                            if not success:
-                                logger.warning("Message processing failed")
-                        except Exception as e:
-                            logger.error(f"Error processing message: {e}", exc_info=True)
+                        messages.append(self.message_queue.get_nowait())
                     except queue.Empty:
-                        pass
+                        break
+
+                if messages:
+                    logger.info(f"Processing {len(messages)} message(s) from queue")
+                    try:
+                        success = self.process_messages_in_worker(messages)
+                        if not success:
+                            logger.warning("Message processing failed")
+                    except Exception as e:
+                        logger.error(f"Error processing messages: {e}", exc_info=True)
 
         except Exception as e:
             logger.error(f"Fatal worker error: {e}", exc_info=True)
@@ -147,7 +167,10 @@ class AioPikaTqApiService(ABC):
 
                 async with connection:
                     channel = await connection.channel()
-                    await channel.set_qos(prefetch_count=1)
+                    # Prefetch > 1 keeps deliveries flowing while the worker
+                    # thread drains its queue; 1 serialized every message
+                    # behind an ack round trip
+                    await channel.set_qos(prefetch_count=100)
 
                     exchange = await channel.declare_exchange(
                         exchange_name,
@@ -164,7 +187,7 @@ class AioPikaTqApiService(ABC):
                         async for message in queue_iter:
                             async with message.process():
                                 try:
-                                    message_dict = json.loads(message.body)
+                                    message_dict = orjson.loads(message.body)
 
                                     try:
                                         self.message_queue.put_nowait(message_dict)
@@ -172,7 +195,7 @@ class AioPikaTqApiService(ABC):
                                         logger.warning("Queue full, dropping message")
                                         raise Exception("Queue full")
 
-                                except json.JSONDecodeError as e:
+                                except orjson.JSONDecodeError as e:
                                     logger.error(f"Invalid JSON: {e}")
 
                             if self.shutdown_event.is_set():
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Base class for synchronous single-loop services
+"""
+import signal
+import sys
+from abc import ABC, abstractmethod
+
+from loguru import logger
+
+from shared.config import get_config
+
+
+class BaseService(ABC):
+    """
+    Lifecycle template for services that run one blocking loop.
+
+    Subclasses implement get_service_name() plus the init_resources /
+    start / stop / cleanup_resources hooks; logging, signal handling and
+    the run() skeleton live here once instead of being copied per service.
+    """
+
+    def __init__(self):
+        self.config = get_config()
+        self.running = False
+
+    @abstractmethod
+    def get_service_name(self) -> str:
+        pass
+
+    @abstractmethod
+    def init_resources(self):
+        """Create clients/connections before the main loop starts"""
+        pass
+
+    @abstractmethod
+    def start(self):
+        """Run the blocking main loop"""
+        pass
+
+    def stop(self):
+        """Interrupt the blocking main loop; override if there is one to stop"""
+        pass
+
+    @abstractmethod
+    def cleanup_resources(self):
+        """Close clients/connections after the main loop exits"""
+        pass
+
+    def setup_logging(self):
+        service_name = self.get_service_name()
+
+        logger.remove()
+        # Only pay for ANSI colorizing on an interactive terminal - under
+        # systemd/docker plain text is cheaper and friendlier to log shippers
+        if sys.stdout.isatty():
+            console_format = (f"<green>{{time:YYYY-MM-DD HH:mm:ss}}</green> | "
+                              f"<level>{{level: <8}}</level> | "
+                              f"<cyan>{service_name}</cyan> - <level>{{message}}</level>")
+            colorize = True
+        else:
+            console_format = (f"{{time:YYYY-MM-DD HH:mm:ss}} | {{level: <8}} | "
+                              f"{service_name} - {{message}}")
+            colorize = False
+
+        logger.add(
+            sys.stdout,
+            format=console_format,
+            level="INFO",
+            colorize=colorize
+        )
+        logger.add(
+            f"logs/tq_{service_name}.log",
+            format=f"{{time:YYYY-MM-DD HH:mm:ss}} | {{level: <8}} | {service_name} - {{message}}",
+            level="INFO",
+            rotation="10 MB",
+            retention="7 days"
+        )
+
+    def signal_handler(self, signum, frame):
+        logger.info(f"Received signal {signum}, shutting down...")
+        self.running = False
+        self.stop()
+
+    def run(self):
+        self.setup_logging()
+        logger.info("=" * 50)
+        logger.info(f"Starting {self.get_service_name()} service")
+        logger.info("=" * 50)
+
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+
+        try:
+            self.init_resources()
+            self.running = True
+            self.start()
+        except KeyboardInterrupt:
+            logger.info("Keyboard interrupt received")
+        except Exception as e:
+            logger.error(f"Fatal error: {e}", exc_info=True)
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        logger.info("Shutting down...")
+        try:
+            self.cleanup_resources()
+        except Exception as e:
+            logger.error(f"Error cleaning up: {e}")
+        logger.info("Shutdown complete")
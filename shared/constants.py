@@ -32,4 +32,4 @@ POSITION_LOOP_INTERVAL_SECONDS = 5    # Loop monitor check interval
 UNIVERSE_REFRESH_INTERVAL_SECONDS = 1800  # 30 minutes for universe refresh
 
 # Exchanges that require CLOSETODAY handling
-CLOSETODAY_EXCHANGES = {"SHFE", "INE"}
+CLOSETODAY_EXCHANGES = frozenset({"SHFE", "INE"})
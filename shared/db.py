@@ -0,0 +1,73 @@
+"""
+Shared SQLAlchemy engine factory
+"""
+import atexit
+from typing import Dict
+
+from loguru import logger
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from shared.config import Config
+
+# One engine (and therefore one pool) per DSN per process: writers that
+# happen to live in the same process share connections instead of each
+# opening their own pool
+_engines: Dict[str, Engine] = {}
+
+
+def build_db_url(config: Config) -> str:
+    """Build the PostgreSQL DSN from service config"""
+    db_config = config.database
+    return (f"postgresql://{db_config['user']}:{db_config['password']}"
+            f"@{db_config['host']}:{db_config['port']}/{db_config['dbname']}")
+
+
+def get_engine(config: Config) -> Engine:
+    """
+    Return the process-wide engine for the configured database.
+
+    The engine is created on first use and cached by DSN; later callers
+    get the same pool. Callers must not dispose it — use dispose_engines
+    at process shutdown.
+    """
+    db_url = build_db_url(config)
+    engine = _engines.get(db_url)
+    if engine is None:
+        db_config = config.database
+        # LIFO checkout keeps reusing the hottest connections (warm TCP
+        # and backend caches) and lets idle ones age out via pool_recycle;
+        # pre_ping can be switched off via config when PgBouncer fronts
+        # the database
+        engine = create_engine(
+            db_url,
+            pool_pre_ping=db_config.get('pool_pre_ping', True),
+            pool_use_lifo=True,
+            # Sized so bursts queue on the database, not on the client
+            # pool: unlimited overflow with a short checkout timeout, and
+            # TCP keepalives so recycled-looking idle connections are
+            # caught by the OS instead of a reconnect storm
+            pool_size=db_config.get('pool_size', 20),
+            max_overflow=db_config.get('max_overflow', -1),
+            pool_timeout=db_config.get('pool_timeout', 5),
+            pool_recycle=db_config.get('pool_recycle', 3600),
+            connect_args={"keepalives": 1, "keepalives_idle": 30},
+            # psycopg2 fast executemany: multi-row parameter lists fold
+            # into VALUES pages instead of one round trip per row
+            executemany_mode="values_plus_batch",
+            executemany_values_page_size=500,
+            executemany_batch_page_size=500
+        )
+        _engines[db_url] = engine
+        logger.info("Database engine created")
+    return engine
+
+
+def dispose_engines():
+    """Dispose every cached engine (process shutdown only)"""
+    for engine in _engines.values():
+        engine.dispose()
+    _engines.clear()
+
+
+atexit.register(dispose_engines)
@@ -274,29 +274,72 @@ class OrderHistoryFuturesChn:
             trade_records=data.get('trade_records')
         )
 
+    @staticmethod
+    def _serialize_trade_records(trade_records_raw: Any) -> Optional[Dict[str, Any]]:
+        """Convert TqSDK trade_records to a JSON-safe dict (None if empty)"""
+        if not trade_records_raw:
+            return None
+        try:
+            trade_records_serializable = {}
+            for trade_id, trade_data in trade_records_raw.items():
+                # Extract only serializable fields from trade data
+                if hasattr(trade_data, '__dict__'):
+                    # If it's an object, convert to dict with only basic types
+                    trade_records_serializable[trade_id] = {
+                        k: v for k, v in trade_data.__dict__.items()
+                        if isinstance(v, (str, int, float, bool, type(None)))
+                    }
+                elif isinstance(trade_data, dict):
+                    trade_records_serializable[trade_id] = trade_data
+            return trade_records_serializable
+        except Exception:
+            # If serialization fails, skip trade_records
+            return None
+
+    @classmethod
+    def from_tqsdk_order_dict(cls, order: Any, portfolio_id: str) -> Dict[str, Any]:
+        """
+        Build the to_dict() payload straight from a TqSDK order.
+
+        Fuses from_tqsdk_order + to_dict into one pass so per-event hot
+        loops skip the intermediate dataclass and the asdict walk.
+        """
+        return {
+            'order_id': getattr(order, 'order_id', ''),
+            'exchange_order_id': getattr(order, 'exchange_order_id', ''),
+            'exchange_id': getattr(order, 'exchange_id', ''),
+            'instrument_id': getattr(order, 'instrument_id', ''),
+            'direction': getattr(order, 'direction', ''),
+            'order_offset': getattr(order, 'offset', ''),
+            'volume_orign': int(getattr(order, 'volume_orign', 0)),
+            'volume_left': int(getattr(order, 'volume_left', 0)),
+            'limit_price': float(getattr(order, 'limit_price', 0)),
+            'price_type': getattr(order, 'price_type', ''),
+            'volume_condition': getattr(order, 'volume_condition', ''),
+            'time_condition': getattr(order, 'time_condition', ''),
+            'insert_date_time': int(getattr(order, 'insert_date_time', 0)),
+            'last_msg': getattr(order, 'last_msg', ''),
+            'status': getattr(order, 'status', ''),
+            'is_dead': bool(getattr(order, 'is_dead', False)),
+            'is_online': bool(getattr(order, 'is_online', False)),
+            'is_error': bool(getattr(order, 'is_error', False)),
+            'trade_price': float(getattr(order, 'trade_price', 0)),
+            'qpto_portfolio_id': portfolio_id,
+            'qpto_contract_code': '',
+            'sender_type': '',
+            'qpto_order_tag': '',
+            'qpto_trading_date': '',
+            'exchange_trading_date': '',
+            'origin_timestamp': 0,
+            'trade_records': cls._serialize_trade_records(getattr(order, 'trade_records', None))
+        }
+
     @classmethod
     def from_tqsdk_order(cls, order: Any, portfolio_id: str) -> 'OrderHistoryFuturesChn':
         """Create from TqSDK order object"""
         # Serialize trade_records to be JSON-safe
-        trade_records_raw = getattr(order, 'trade_records', None)
-        trade_records_serializable = None
-        if trade_records_raw:
-            try:
-                # Convert trade_records to a serializable dict
-                trade_records_serializable = {}
-                for trade_id, trade_data in trade_records_raw.items():
-                    # Extract only serializable fields from trade data
-                    if hasattr(trade_data, '__dict__'):
-                        # If it's an object, convert to dict with only basic types
-                        trade_records_serializable[trade_id] = {
-                            k: v for k, v in trade_data.__dict__.items()
-                            if isinstance(v, (str, int, float, bool, type(None)))
-                        }
-                    elif isinstance(trade_data, dict):
-                        trade_records_serializable[trade_id] = trade_data
-            except Exception:
-                # If serialization fails, skip trade_records
-                trade_records_serializable = None
+        trade_records_serializable = cls._serialize_trade_records(
+            getattr(order, 'trade_records', None))
 
         return cls(
             order_id=getattr(order, 'order_id', ''),
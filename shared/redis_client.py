@@ -2,7 +2,7 @@
 Redis client helper for TqSDK Broker Connect services
 """
 import json
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import redis
 from loguru import logger
 
@@ -21,19 +21,26 @@ class RedisClient:
 
     def __init__(self, config: Config):
         self.config = config
+        self.pool: Optional[redis.ConnectionPool] = None
         self.client: Optional[redis.Redis] = None
         self.connect()
 
     def connect(self):
-        """Establish connection to Redis"""
+        """Establish connection to Redis via a bounded connection pool"""
         try:
-            self.client = redis.Redis(
+            # The pool reuses sockets across commands and reconnects, so
+            # transient failures do not pay a fresh TCP+AUTH handshake, and
+            # max_connections bounds FD usage per service process
+            self.pool = redis.BlockingConnectionPool(
                 host=self.config.redis['host'],
                 port=self.config.redis['port'],
                 password=self.config.redis.get('password'),
                 db=self.config.redis.get('db', 0),
+                max_connections=32,
+                timeout=5,
                 decode_responses=True
             )
+            self.client = redis.Redis(connection_pool=self.pool)
             self.client.ping()
             logger.info("Redis client connected")
         except Exception as e:
@@ -52,6 +59,21 @@ class RedisClient:
             logger.error(f"Failed to set full position: {e}")
             raise
 
+    def set_full_positions(self, portfolio_id: str, positions: Dict[str, FullPosition],
+                           ttl: int = POSITION_TTL):
+        """Set full positions for several symbols in one pipelined round trip"""
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for symbol, position in positions.items():
+                    key = REDIS_POSITION_KEY_PATTERN.format(
+                        portfolio_id=portfolio_id, symbol=symbol)
+                    pipe.setex(key, ttl, position.to_json())
+                pipe.execute()
+            logger.debug(f"Full positions set for {len(positions)} symbol(s)")
+        except Exception as e:
+            logger.error(f"Failed to set full positions: {e}")
+            raise
+
     def get_full_position(self, portfolio_id: str, symbol: str) -> Optional[FullPosition]:
         """Get full position dict from Redis"""
         key = REDIS_POSITION_KEY_PATTERN.format(portfolio_id=portfolio_id, symbol=symbol)
@@ -62,6 +84,27 @@ class RedisClient:
             logger.error(f"Failed to get full position: {e}")
             return None
 
+    def get_full_positions(self, portfolio_id: str,
+                           symbols: List[str]) -> Dict[str, Optional[FullPosition]]:
+        """Get full positions for several symbols in one MGET round trip"""
+        if not symbols:
+            return {}
+        keys = [
+            REDIS_POSITION_KEY_PATTERN.format(portfolio_id=portfolio_id, symbol=symbol)
+            for symbol in symbols
+        ]
+        try:
+            # One MGET command: a single server dispatch instead of a
+            # pipeline of N GETs parsed individually
+            values = self.client.mget(keys)
+            return {
+                symbol: FullPosition.from_json(value) if value else None
+                for symbol, value in zip(symbols, values)
+            }
+        except Exception as e:
+            logger.error(f"Failed to get full positions: {e}")
+            return {symbol: None for symbol in symbols}
+
     def refresh_position_ttl(self, portfolio_id: str, symbol: str, ttl: int = POSITION_TTL) -> bool:
         """Refresh TTL for existing position key"""
         key = REDIS_POSITION_KEY_PATTERN.format(portfolio_id=portfolio_id, symbol=symbol)
@@ -71,6 +114,20 @@ class RedisClient:
             logger.error(f"Failed to refresh position TTL: {e}")
             return False
 
+    def refresh_position_ttls(self, portfolio_id: str, symbols: List[str],
+                              ttl: int = POSITION_TTL):
+        """Refresh TTLs for several position keys in one pipelined round trip"""
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for symbol in symbols:
+                    key = REDIS_POSITION_KEY_PATTERN.format(
+                        portfolio_id=portfolio_id, symbol=symbol)
+                    pipe.expire(key, ttl)
+                pipe.execute()
+            logger.debug(f"Position TTL refreshed for {len(symbols)} symbol(s)")
+        except Exception as e:
+            logger.error(f"Failed to refresh position TTLs: {e}")
+
     # Account operations
     def set_account(self, portfolio_id: str, account_data: Dict[str, Any], ttl: int = ACCOUNT_TTL):
         """Set account data in Redis"""
@@ -82,6 +139,19 @@ class RedisClient:
             logger.error(f"Failed to set account data: {e}")
             raise
 
+    def set_accounts(self, accounts: List[Tuple[str, Dict[str, Any]]], ttl: int = ACCOUNT_TTL):
+        """Set multiple account entries in one pipelined round trip"""
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for portfolio_id, account_data in accounts:
+                    key = REDIS_ACCOUNT_KEY_PATTERN.format(portfolio_id=portfolio_id)
+                    pipe.setex(key, ttl, json.dumps(account_data))
+                pipe.execute()
+            logger.debug(f"Account data set for {len(accounts)} update(s)")
+        except Exception as e:
+            logger.error(f"Failed to set account data: {e}")
+            raise
+
     def get_account(self, portfolio_id: str) -> Optional[Dict[str, Any]]:
         """Get account data from Redis"""
         key = REDIS_ACCOUNT_KEY_PATTERN.format(portfolio_id=portfolio_id)
@@ -97,6 +167,8 @@ class RedisClient:
         if self.client:
             try:
                 self.client.close()
+                if self.pool:
+                    self.pool.disconnect()
                 logger.info("Redis client closed")
             except Exception as e:
                 logger.error(f"Error closing Redis connection: {e}")
@@ -19,13 +19,14 @@ import threading
 import queue
 import signal
 import sys
+from pathlib import Path
 import json
 from datetime import datetime
 from typing import Optional
 import time
 import pandas as pd
 
-sys.path.insert(0, '/workspaces/tqsdk_broker_connect')
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from loguru import logger
 from tqsdk import TqApi
@@ -1,6 +1,7 @@
 """
 Connection checker for validating external service availability
 """
+import asyncio
 import redis
 import pika
 from sqlalchemy import create_engine, text
@@ -247,11 +248,25 @@ def check_all_connections(config: Config, timeout: int = 5) -> bool:
         ("TqSDK", check_tqsdk_connection)
     ]
 
+    # Run the blocking checks concurrently so total startup wait is
+    # max(timeouts) instead of their sum
+    async def _run_all():
+        return await asyncio.gather(
+            *(asyncio.to_thread(check_func, config, timeout) for _, check_func in checks),
+            return_exceptions=True
+        )
+
+    logger.info(f"Checking {', '.join(name for name, _ in checks)} connections concurrently...")
+    results = asyncio.run(_run_all())
+
     all_ok = True
-    for name, check_func in checks:
-        logger.info(f"Checking {name} connection...")
-        success, error_msg = check_func(config, timeout)
+    for (name, _), result in zip(checks, results):
+        if isinstance(result, BaseException):
+            logger.error(f"✗ {name} check failed: {result}")
+            all_ok = False
+            continue
 
+        success, error_msg = result
         if not success:
             logger.error(f"✗ {name} check failed: {error_msg}")
             all_ok = False
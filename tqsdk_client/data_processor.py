@@ -17,7 +17,7 @@ class DataProcessor:
 
     CURRENT_POS_TTL = 3600  # 1 hour in seconds
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, redis_pool: Optional[redis.ConnectionPool] = None):
         """
         Initialize data processor
 
@@ -25,18 +25,24 @@ class DataProcessor:
         ----------
         config : Config
             Configuration instance
+        redis_pool : redis.ConnectionPool, optional
+            Shared connection pool; when provided, connections are reused
+            across components instead of opening a new socket here
         """
         self.config = config
 
         # Initialize Redis connection
-        redis_config = config.redis
-        self.redis_client = redis.Redis(
-            host=redis_config['host'],
-            port=redis_config['port'],
-            password=redis_config['password'],
-            db=redis_config['db'],
-            decode_responses=True
-        )
+        if redis_pool is not None:
+            self.redis_client = redis.Redis(connection_pool=redis_pool)
+        else:
+            redis_config = config.redis
+            self.redis_client = redis.Redis(
+                host=redis_config['host'],
+                port=redis_config['port'],
+                password=redis_config['password'],
+                db=redis_config['db'],
+                decode_responses=True
+            )
 
         # Initialize database connection
         db_config = config.database
@@ -139,14 +145,20 @@ class DataProcessor:
         """
         try:
             pattern = f"TQ_Position_PortfolioId_{self.config.portfolio_id}_Symbol_*"
-            positions = {}
-
-            for key in self.redis_client.scan_iter(match=pattern):
-                symbol = key.split('_Symbol_')[-1]
-                position = float(self.redis_client.get(key) or 0)
-                positions[symbol] = position
-
-            return positions
+            keys = list(self.redis_client.scan_iter(match=pattern))
+            if not keys:
+                return {}
+
+            # Fetch all values in one pipelined round trip instead of one GET per key
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                values = pipe.execute()
+
+            return {
+                key.split('_Symbol_')[-1]: float(value or 0)
+                for key, value in zip(keys, values)
+            }
         except Exception as e:
             logger.error(f"Failed to get positions from Redis: {e}")
             return {}
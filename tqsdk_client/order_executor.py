@@ -18,7 +18,8 @@ class OrderExecutor:
     # Exchanges that require CLOSETODAY for same-day positions
     CLOSETODAY_EXCHANGES = {"SHFE", "INE"}  # Shanghai Futures Exchange, International Energy Exchange
 
-    def __init__(self, config: Config, stream_handler: TqDataStreamHandler):
+    def __init__(self, config: Config, stream_handler: TqDataStreamHandler,
+                 prefetch_count: int = 10):
         """
         Initialize order executor
 
@@ -28,9 +29,13 @@ class OrderExecutor:
             Configuration instance
         stream_handler : TqDataStreamHandler
             TQ data stream handler instance
+        prefetch_count : int
+            Consumer QoS window; a bounded window of unacked deliveries
+            keeps the consumer fed without unbounded buffering
         """
         self.config = config
         self.stream_handler = stream_handler
+        self.prefetch_count = prefetch_count
 
         self.connection: Optional[pika.BlockingConnection] = None
         self.channel: Optional[pika.channel.Channel] = None
@@ -119,7 +124,7 @@ class OrderExecutor:
             )
 
             # Setup consumer
-            self.channel.basic_qos(prefetch_count=1)
+            self.channel.basic_qos(prefetch_count=self.prefetch_count)
             self.channel.basic_consume(
                 queue=queue_name,
                 on_message_callback=self._on_order_message